@@ -2,8 +2,9 @@
 # we can build bronze_ingest.py to orchestrate all three ingestion scripts together.
 
 import os 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from pipelines.bronzer import eia_prices, eia_storage, eia_supply
+from pipelines.bronze import eia_prices, eia_storage, eia_supply
 
 # This is a databricks notebook that functions as an entrypoint to run all bronze ingestion scripts.
 # It wires widget inputs into env vars and delegates to pipelines/bronze/*. 
@@ -16,7 +17,7 @@ from pipelines.bronzer import eia_prices, eia_storage, eia_supply
 try:
     # dbutils.widgets.text defines a text widget; get(...) retrieves its value.
     # where a text widget is a text input box in databricks UI
-    dbutils.widget.text("EIA_API_KEY", "")
+    dbutils.widgets.text("EIA_API_KEY", "")
     widget_key = dbutils.widgets.get("EIA_API_KEY") # returns "" if empty
 except Exception:
     widget_key = "" # local runs won't have dbutils
@@ -27,9 +28,13 @@ if widget_key:
     os.environ["EIA_API_KEY"] = widget_key # set env so pipelines can read it.
     
 # Call each ingestion script; each writes a bronze table under data/bronze/.
-eia_prices.main()
-eia_supply.main()
-eia_storage.main()
+# The three jobs are independent and mostly wait on their EIA HTTPS call, so we run them on a thread pool
+# to overlap the network waits; wall-clock is then bounded by the slowest fetch instead of the sum of all three.
+with ThreadPoolExecutor(max_workers=3) as executor:
+    futures = [executor.submit(job) for job in (eia_prices.main, eia_supply.main, eia_storage.main)]
+    # as_completed yields futures as they finish; .result() re-raises any exception from that job
+    for future in as_completed(futures):
+        future.result()
 
 
 
@@ -12,72 +12,128 @@
 
 from __future__ import annotations  # for forward compatibility with future Python versions
 
+from functools import lru_cache
 from pathlib import Path 
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from pipelines._io import (
+    PYARROW_WRITE_OPTIONS,
+    gold_prices_table,
+    gold_storage_table,
+    gold_supply_table,
+    latest_file,
+    read_table,
+)
+from pipelines._numba_kernels import NUMBA_AVAILABLE, NUMBA_MIN_ROWS, rolling_std_fixed
 
 silver_root = Path("data/silver")  # directory where silver tables are stored
 gold_root = Path("data/gold")  # directory where gold tables will be stored
 
-# recall, this is is exactly the same helper function as in silver_clean.py
-# We're reusing it here to find the latest silver files but we won't import it from silver for clarity.
-# If we happen to use it in many places, we could refactor it into a shared utils module.
-def _latest_file(table_dir: Path) -> Path:
-    files = sorted(table_dir.glob("*.parquet")) or sorted(table_dir.glob("*.csv"))
-    if not files:
-        raise FileNotFoundError(f"No silver files found in {table_dir}")
-    return files[-1] # return the last file in sorted order, which is the most recent
+# Like silver_clean.py, gold works on Arrow tables (pa.Table) from read to write, so no pandas DataFrame is built here;
+# pandas only comes back at the Postgres handoff in gold_to_postgres.py.
 
 # reading silver tables (similar to _read_bronze in silver_clean.py)
-def _read_silver(table: str) -> pd.DataFrame:
+# columns= limits the read to the columns the feature code actually uses (projection pushdown):
+# parquet only decompresses those column chunks, so fewer bytes are read and decoded.
+def _read_silver(table: str, columns: tuple[str, ...] | None = None) -> pa.Table:
     table_dir = silver_root/table # construct the path to the silver table directory
-    latest = _latest_file(table_dir)
-    if latest.suffix == ".parquet":
-        return pd.read_parquet(latest) 
-    return pd.read_csv(latest) # read csv file into a df, as a fallback.
-
-def _write_gold(df: pd.DataFrame, table: str) -> Path:
+    latest = latest_file(table_dir)
+    return _read_silver_file(latest, columns)
+
+# Memoize decoded silver tables so several feature sets built from the same silver file skip the parquet decode.
+# pa.Table is immutable, so handing the same cached table to every caller is safe; the feature functions
+# only derive new arrays from it. The key is the file path (+ columns, a tuple so it's hashable), so a newer
+# silver write is a cache miss automatically; call _read_silver_file.cache_clear() to drop memory between DAG runs.
+@lru_cache(maxsize=8)
+def _read_silver_file(path: Path, columns: tuple[str, ...] | None) -> pa.Table:
+    return read_table(path, columns=list(columns) if columns else None) # parquet into an Arrow table (or csv, as a fallback)
+
+def _write_gold(tbl: pa.Table, table: str) -> Path:
     gold_root.mkdir(parents=True, exist_ok=True) # ensure the gold root directory exists
     out_dir = gold_root/table # construct the path to the gold table directory
     out_dir.mkdir(parents=True, exist_ok=True) # ensure the gold table directory exists
     timestamp = pd.Timestamp.utcnow().strftime("%Y%m%dT%H%M%SZ") 
     path = out_dir/f"{timestamp}.parquet" # construct the output file path with the timestamp
-    df.to_parquet(path, index = False)
+    pq.write_table(tbl, path, **PYARROW_WRITE_OPTIONS) # zstd + dictionary encoding, see pipelines/_io.py
     return path
 
 # feature engineering functions for each data source (to make data purpose-built)
-def _price_features(prices: pd.DataFrame) -> pd.DataFrame:
-    prices = prices.copy()
-    prices = prices.sort_values("date") # .sort_values returns a new df sorted by date
-    prices["return_1w"] = prices["value"].pct_change() # compute 1-week percentage change
-    prices["vol_4w"] = prices["return_1w"].rolling(4).std() # compute 4-week rolling volatility
-    return prices[["date", "value", "return_1w", "vol_4w"]] # recall, [[]] returns a df with selected columns
-
-def _supply_features(supply: pd.DataFrame) -> pd.DataFrame:
-    supply = supply.copy()
-    supply = supply.sort_values("date")
-    supply["supply_delta"] = supply["value"].diff() # compute week-over-week difference
-    return supply[["date", "value", "supply_delta"]] 
-
-def _storage_features(storage: pd.DataFrame) -> pd.DataFrame:
-    storage = storage.copy()
-    storage = storage.sort_values("date")
-    storage["inventory_delta"] = storage["value"].diff() # compute week-over-week difference
-    return storage[["date", "value", "inventory_delta"]]
+# We sort the table once by date, pull the "value" column out as a contiguous float64 NumPy array,
+# and compute returns/deltas/rolling volatility directly on the arrays. This skips pandas' per-call
+# dispatch in pct_change/diff/rolling and builds each output table in a single allocation.
+
+def _sorted_arrays(tbl: pa.Table) -> tuple[pa.ChunkedArray, np.ndarray]:
+    # sort_indices returns the row order that sorts by date; take() gathers rows in that order
+    tbl = tbl.take(pc.sort_indices(tbl, sort_keys=[("date", "ascending")]))
+    dates = tbl.column("date") # stays an Arrow column and goes straight into the output table
+    # cast float32 silver values up to float64 so the feature math runs at full precision; nulls become NaN
+    values = pc.cast(tbl.column("value"), pa.float64()).to_numpy()
+    return dates, values
+
+def _rolling_std(x: np.ndarray, window: int) -> np.ndarray:
+    # Sample (ddof=1) rolling std via the cumulative-sum trick on x and x**2, matching .rolling(window).std().
+    # A window is only valid once it holds `window` finite values, so NaNs are zeroed in the sums and counted separately.
+    out = np.full(len(x), np.nan)
+    if len(x) < window:
+        return out
+    finite = np.isfinite(x)
+    xf = np.where(finite, x, 0.0)
+    csum = np.concatenate(([0.0], np.cumsum(xf)))
+    csum2 = np.concatenate(([0.0], np.cumsum(xf * xf)))
+    count = np.concatenate(([0], np.cumsum(finite)))
+    window_mean = (csum[window:] - csum[:-window]) / window
+    window_var = (csum2[window:] - csum2[:-window]) / window - window_mean**2
+    window_var = np.maximum(window_var, 0.0) * window / (window - 1) # clip tiny negative round-off, then rescale to ddof=1
+    full = (count[window:] - count[:-window]) == window
+    out[window - 1:] = np.where(full, np.sqrt(window_var), np.nan)
+    return out
+
+def _price_features(prices: pa.Table) -> pa.Table:
+    dates, arr = _sorted_arrays(prices)
+    ret = np.empty_like(arr)
+    ret[:1] = np.nan # first week has no prior price to compare against
+    ret[1:] = arr[1:] / arr[:-1] - 1 # compute 1-week percentage change
+    # compute 4-week rolling volatility; long series go to the Numba-compiled Welford kernel when numba is installed
+    if NUMBA_AVAILABLE and len(ret) > NUMBA_MIN_ROWS:
+        vol = rolling_std_fixed(ret, 4)
+    else:
+        vol = _rolling_std(ret, 4)
+    return pa.table({"date": dates, "value": arr, "return_1w": ret, "vol_4w": vol})
+
+def _supply_features(supply: pa.Table) -> pa.Table:
+    dates, arr = _sorted_arrays(supply)
+    delta = np.empty_like(arr)
+    delta[:1] = np.nan
+    delta[1:] = np.diff(arr) # compute week-over-week difference
+    return pa.table({"date": dates, "value": arr, "supply_delta": delta})
+
+def _storage_features(storage: pa.Table) -> pa.Table:
+    dates, arr = _sorted_arrays(storage)
+    delta = np.empty_like(arr)
+    delta[:1] = np.nan
+    delta[1:] = np.diff(arr) # compute week-over-week difference
+    return pa.table({"date": dates, "value": arr, "inventory_delta": delta})
 
 def main() -> None:
-    prices = _read_silver("silver_eia_prices")
-    supply = _read_silver("silver_eia_supply")
-    storage = _read_silver("silver_eia_storage")
+    # the feature functions only need date and value, so skip the other silver columns on read
+    feature_inputs = ("date", "value")
+    prices = _read_silver("silver_eia_prices", columns=feature_inputs)
+    supply = _read_silver("silver_eia_supply", columns=feature_inputs)
+    storage = _read_silver("silver_eia_storage", columns=feature_inputs)
 
     gold_prices = _price_features(prices) # note: is not gold commodity but refers to the gold data tier
     gold_supply = _supply_features(supply)
     gold_storage = _storage_features(storage)
 
     # output gold feature tables
-    out_prices = _write_gold(gold_prices, "gold_eia_prices")
-    out_supply = _write_gold(gold_supply, "gold_eia_supply")
-    out_storage = _write_gold(gold_storage, "gold_eia_storage")
+    out_prices = _write_gold(gold_prices, gold_prices_table)
+    out_supply = _write_gold(gold_supply, gold_supply_table)
+    out_storage = _write_gold(gold_storage, gold_storage_table)
 
     print(f"Logged gold prices to {out_prices}")
     print(f"Logged gold supply to {out_supply}")
@@ -13,64 +13,95 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+from sqlalchemy.orm import Session
 
-from src.db.models import Base
-from src.db.session import engine
+from pipelines._io import gold_prices_table, gold_storage_table, gold_supply_table, latest_file
+from src.db.models import COMMODITIES, Base, GoldFeature
+from src.db.session import COPY_DRIVERS, COPY_MIN_ROWS, SessionLocal, bulk_insert, copy_dataframe, get_engine
 
 gold_root = Path("data/gold")
 
-def _latest_file(table_dir: Path) -> Path:
-    files = sorted(table_dir.glob("*.parquet")) or sorted(table_dir.glob("*.csv"))
-    if not files:
-        raise FileNotFoundError(f"No gold files found in {table_dir}")
-    return files[-1]
+# The commodities we serve (the labels of the commodity_enum column). Storing commodity as a Categorical with this
+# fixed dtype keeps one small int code per row instead of a Python string, and every long df shares the same categories.
+COMMODITY_CATS = pd.CategoricalDtype(COMMODITIES, ordered=False)
 
-def _read_gold(table: str) -> pd.DataFrame:
+def _read_gold(table: str, columns: list[str] | None = None) -> pd.DataFrame:
     # get table_dir by appending desired table to gold_root directory
     # then retrieve latest file
     # if latest file is a parquet format, then we read it with pandas' .read_parquet to parse file
     # otherwise, fallback to reading with csv via .read_csv
+    # columns= reads only the listed columns (projection pushdown), so unused column chunks are never decoded
     table_dir = gold_root/table
-    latest = _latest_file(table_dir)
-    if latest.suffix == '*.parquet': 
-        return pd.read_parquet(latest)
-    return pd.read_csv(latest)
+    latest = latest_file(table_dir)
+    if latest.suffix == '.parquet': # recall, Path.suffix includes the dot but no wildcard
+        return pd.read_parquet(latest, columns=columns, engine="pyarrow")
+    return pd.read_csv(latest, usecols=columns)
 
 def _to_long_features(df: pd.DataFrame, feature_cols: list[str]) -> pd.DataFrame:
     # Convert wide feature columns into long rows for gold_features table
-    # recall, df.melt is a pandas function that reshapes dataframes from wide to long format
-    long_df = df.melt(
-        id_vars = ["date"],
-        value_vars = feature_cols,
-        var_name = "feature_name",
-        value_name = "feature_value",
-    ) 
-    long_df = long_df.rename(columns={"date": "week"}) # rename "date" column to "week" for consistency with database schema
-    long_df["commodity"] = "wti" # add a new column "commodity" with constant value "wti"
-    return long_df[["commodity", "week", "feature_name", "feature_value"]]
+    # Same layout as df.melt (all rows of the first feature, then the next, ...), but built directly from NumPy
+    # arrays so no intermediate frames or per-cell var_name column are created along the way.
+    n_rows, n_cols = len(df), len(feature_cols)
+    week = np.tile(df["date"].to_numpy(), n_cols) # dates repeated once per feature; "date" becomes "week" for the db schema
+    # each feature name repeated once per row, as Categorical codes (0, 0, ..., 1, 1, ...) over the feature names
+    feature_name = pd.Categorical.from_codes(np.repeat(np.arange(n_cols, dtype=np.int8), n_rows), categories=feature_cols)
+    # ravel(order="F") reads the (rows x features) block column by column, matching the week/feature_name order
+    feature_value = df[feature_cols].to_numpy(dtype="float64").ravel(order="F")
+    return pd.DataFrame({
+        "commodity": pd.Categorical(["wti"], dtype=COMMODITY_CATS).repeat(len(feature_value)), # one code per row
+        "week": week,
+        "feature_name": feature_name,
+        "feature_value": feature_value,
+    })
+
+# Columns we load into gold_features (id and created_at are filled in by Postgres) and their Postgres types,
+# used by the binary COPY path (an enum's binary form is its label's text, so commodity is sent as text)
+gold_feature_columns = ["commodity", "week", "feature_name", "feature_value"]
+gold_feature_types = ["text", "date", "text", "float8"]
+
+# Write a long feature df into gold_features, picking the fastest path for its size and the engine's driver.
+# Returns the number of rows written.
+def _load_features(session: Session, df: pd.DataFrame) -> int:
+    # feature_value is NOT NULL in gold_features, and a NaN (eg: no 1-week return in the first week) isn't a signal.
+    # Both paths would send it as NULL (COPY reads an empty CSV field as NULL), so drop those rows up front.
+    df = df.dropna(subset=["feature_value"])
+    # COPY ... FROM STDIN streams every row in one command, bound by the network instead of statement round-trips;
+    # it pays off on large frames and needs a psycopg driver (see copy_dataframe in src/db/session.py)
+    if len(df) > COPY_MIN_ROWS and session.get_bind().dialect.driver in COPY_DRIVERS:
+        copy_dataframe(session, GoldFeature.__tablename__, df, gold_feature_columns, types=gold_feature_types)
+        return len(df)
+    # otherwise, to_dict(orient="records") turns the df straight into row dicts (no ORM objects), and bulk_insert
+    # sends them as batched multi-row INSERTs
+    bulk_insert(session, GoldFeature, df.to_dict(orient="records"))
+    return len(df)
 
 # Orchestrater function to read gold tables, transform, and load into Postgres
 def main() -> None:
+    engine = get_engine()
     # ensure tables exist before loading (since we're using ORM metadata)
-    Base.metadata.createall(bind=engine)
-
-    gold_prices = _read_gold("gold_prices") # note that gold_prices is a dataframe from gold_features.py
-    gold_supply = _read_gold("gold_supply")
-    gold_storage = _read_gold("gold_storage")
-
-    price_features = _to_long_features(gold_prices, ["value", "return_1w", "vol_4w"])
-    supply_features = _to_long_features(gold_supply, ["value", "supply_delta"])
-    storage_features = _to_long_features(gold_storage, ["value", "inventory_delta"])
-
-    # we use pd.concat to concatenate multiple dataframes into a single dataframe
-    all_features = pd.concat([price_features, supply_features, storage_features], ignore_index=True)
-
-
-    # now that we've constructed all_features dataframe, we can write it to Postgres table
-    all_features.to_sql("gold_features", engine, if_exists="append", index=False)
-
-    print(f"Loaded {len(all_features)} gold feature rows into Postgres.") # generic logging statement
+    Base.metadata.create_all(bind=engine)
+
+    # (gold table, wide feature columns) for each source; gold tables are produced by gold_features.py
+    gold_tables = [
+        (gold_prices_table, ["value", "return_1w", "vol_4w"]),
+        (gold_supply_table, ["value", "supply_delta"]),
+        (gold_storage_table, ["value", "inventory_delta"]),
+    ]
+
+    # Reshape and load one source at a time instead of pd.concat-ing all long dfs first,
+    # so only one long block is in memory at once and we skip the concat copy entirely.
+    # All three loads share one session, so the week's features land in a single transaction (all or nothing).
+    total_rows = 0
+    with SessionLocal(bind=engine) as session:
+        for table, feature_cols in gold_tables:
+            gold_df = _read_gold(table, columns=["date"] + feature_cols) # only load what _to_long_features uses
+            long_df = _to_long_features(gold_df, feature_cols)
+            total_rows += _load_features(session, long_df) # write each long block straight to Postgres as it's produced
+        session.commit()
+
+    print(f"Loaded {total_rows} gold feature rows into Postgres.") # generic logging statement
 
 if __name__ == "__main__":
     main()
@@ -7,52 +7,79 @@
 # Walkthrough Step 5:
 # We implement silver transforms to normalize units and align timestamps across sources
 # so features can be safely joined.
-# We effectively write methods like _latest_file, _read_bronze, _align_weekly, _write_silver to process ingested bronze data.
+# We effectively write methods like _read_bronze, _align_weekly, _write_silver to process ingested bronze data
+# (the latest-file lookup, latest_file, is shared with the gold notebooks via pipelines/_io.py),
 # then we orchestrate these methods in main() to read bronze, clean/align, and write silver tables in one step. 
 
 from __future__ import annotations # for forward compatibility with future Python versions
 
 from pathlib import Path # recall, Path helps with filesystem paths by abstracting OS differences
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 
-# Mechanics note: Path(...).glob returns a generator of matching paths.
+from pipelines._io import PYARROW_WRITE_OPTIONS, latest_file, read_table
+
+# Mechanics note: Path(...) / "subdir" joins paths; latest_file scans a table directory for its newest file.
 bronze_root = Path("data/bronze") # directory where bronze tables are stored
 silver_root = Path("data/silver") # directory where silver tables will be stored
 
-def _latest_file(table_dir: Path) -> Path:
-    # Pick the most recent file by name (timestamps are in the filename)
-    files = sorted(table_dir.glob("*.parquet")) or sorted(table_dir.glob("*.csv")) # recall, glob matches files by pattern: "*.parquet" means all parquet files
-    if not files:
-        raise FileNotFoundError(f"No bronze files found in {table_dir}")
-    return files[-1] # return the last file in sorted order, which is the most recent
+# Silver works on Arrow tables (pa.Table) end to end: read bronze parquet into Arrow, align, and write Arrow back out.
+# That skips two Arrow <-> pandas conversions per table; Arrow columns also convert to NumPy without copying.
 
-def _read_bronze(table: str) -> pd.DataFrame:
+def _read_bronze(table: str) -> pa.Table:
     table_dir = bronze_root/table # construct the path to the bronze table directory
-    latest = _latest_file(table_dir)
-    if latest.suffix == ".parquet":
-        return pd.read_parquet(latest) # read parquet file into a df
-    return pd.read_csv(latest) # read csv file into a df, as a fallback
-
-def _align_weekly(df: pd.DataFrame) -> pd.DataFrame:
-    # Align all sources to weekly frequency (say, Friday) for consistent joins
-    df = df.copy() # avoid modifying the original df
-    df["date"] = pd.to_datetime(df["date"]) # ensure the date column is in datetime format
-    df = df.sort_values("date") # sort by date and returns new df, set to asc by default. sorts by axis=0 (rows) by default
-    df = df.set_index("date") # set date column as index
-    # resample to weekly frequency and forward-fill short gaps. recall, .resample() changes the frequency of the time series data
-    df = df.resample("W-FRI").ffill() # "W-FRI" is weekly frequency on Fridays and ffill is forward fill missing values
-    df = df.reset_index() # reset index to turn date index back into a column. This is important for saving the df later
-    return df
+    latest = latest_file(table_dir)
+    return read_table(latest) # parquet into an Arrow table (or csv, as a fallback)
 
+# 1970-01-01 (day 0 of datetime64[D]) was a Thursday, so Fridays are the days where day % 7 == 1
+def _next_friday(day: np.datetime64) -> np.datetime64:
+    # leaves a Friday as-is, otherwise moves forward to the next Friday
+    return day + np.timedelta64((1 - day.astype(np.int64)) % 7, "D")
 
-def _write_silver(df: pd.DataFrame, table: str) -> Path:
+def _align_weekly(tbl: pa.Table) -> pa.Table:
+    # Align all sources to weekly frequency (say, Friday) for consistent joins
+    # pc.cast parses csv date strings and normalizes parquet timestamps to ns; rows without a date can't be aligned
+    date_idx = tbl.schema.get_field_index("date")
+    tbl = tbl.set_column(date_idx, "date", pc.cast(tbl.column("date"), pa.timestamp("ns")))
+    tbl = tbl.filter(pc.is_valid(tbl.column("date")))
+    if tbl.num_rows == 0:
+        return tbl
+    # sort_indices returns the row order that sorts by date; take() gathers rows in that order
+    tbl = tbl.take(pc.sort_indices(tbl, sort_keys=[("date", "ascending")]))
+    dates = tbl.column("date").to_numpy() # datetime64[ns], no nulls left
+
+    # The weekly Friday grid matches .resample("W-FRI") labels: the first Friday on/after the first date
+    # through the first Friday on/after the last date.
+    days = dates.astype("datetime64[D]")
+    start, end = _next_friday(days[0]), _next_friday(days[-1])
+    fridays = np.arange(start, end + np.timedelta64(1, "D"), np.timedelta64(7, "D")).astype("datetime64[ns]")
+
+    # Forward fill: for each Friday, take the last row dated on or before it (eg: Thursday's price on a Friday holiday).
+    # searchsorted(side="right") - 1 finds that row in one vectorized pass; -1 means no earlier row, so it's masked to null.
+    positions = np.searchsorted(dates, fridays, side="right") - 1
+    tbl = tbl.take(pa.array(positions, mask=positions < 0))
+    tbl = tbl.set_column(date_idx, "date", pa.array(fridays))
+
+    # downcast float64 columns (eg: value) to float32: half the bytes on disk and in memory, and
+    # gold_features.py upcasts to float64 before computing returns, so features keep full precision arithmetic
+    for i, field in enumerate(tbl.schema):
+        if pa.types.is_float64(field.type):
+            tbl = tbl.set_column(i, field.name, pc.cast(tbl.column(i), pa.float32()))
+    return tbl
+
+
+def _write_silver(tbl: pa.Table, table: str) -> Path:
     silver_root.mkdir(parents=True, exist_ok=True) # ensure the silver root directory exists
     out_dir = silver_root/table # construct the path to the silver table directory
     out_dir.mkdir(parents=True, exist_ok=True) # ensure the silver table directory exists
     timestamp = pd.Timestamp.utcnow().strftime("%Y%m%dT%H%M%SZ") # get current UTC timestamp in a specific format, recall strftime formats the timestamp according to "%Y%m%dT%H%M%SZ" meaning year, month, day, T, hour, minute, second, Z
     path = out_dir/f"{timestamp}.parquet" # construct the output file path with the timestamp
-    df.to_parquet(path, index = False) # write the df to a parquet file, setting index to False to avoid writing the index as a column
+    # PYARROW_WRITE_OPTIONS (pipelines/_io.py) writes zstd-compressed, dictionary-encoded row groups
+    pq.write_table(tbl, path, **PYARROW_WRITE_OPTIONS) # write the Arrow table to a parquet file as-is (no index to drop)
     return path
 
 # Orchestrate the silver cleaning process
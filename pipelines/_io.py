@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+from pyarrow import fs
+
+# The purpose here is to keep file I/O settings shared by every tier (bronze, silver, gold) in one place,
+# so pipelines/bronze/_bronze_writer.py and the notebooks/*.py writers all produce the same parquet layout.
+
+# gold table names: notebooks/gold_features.py writes these directories and notebooks/gold_to_postgres.py reads them,
+# so both take the names from here and the writer and the loader can't drift apart
+gold_prices_table = "gold_eia_prices"
+gold_supply_table = "gold_eia_supply"
+gold_storage_table = "gold_eia_storage"
+
+# latest_file is shared by notebooks/silver_clean.py, gold_features.py and gold_to_postgres.py to pick the
+# most recent time-stamped file in a table directory (timestamps are in the filename, so the max name is the newest).
+
+# Files are discovered with pyarrow's filesystem layer (the same listing pyarrow.dataset uses): a recursive
+# FileSelector returns name/type metadata only, without opening any file, and also finds files nested in
+# hive-style partition folders (eg: date=YYYY-MM-DD/...), whose full paths still sort by partition then timestamp.
+
+# lru_cache memoizes the lookup per directory. The directory's mtime is part of the cache key: it changes whenever a
+# file is added or removed, so a new write in the same process (eg: silver then gold in one notebook session)
+# is picked up instead of returning a stale cached path. (With partition folders, only a new folder bumps the
+# top-level mtime, so a partitioned writer should add files under a new partition rather than an existing one.)
+_local_fs = fs.LocalFileSystem()
+
+@lru_cache(maxsize=64)
+def _latest(table_dir: str, suffix: str, mtime_ns: int) -> Path | None:
+    infos = _local_fs.get_file_info(fs.FileSelector(table_dir, recursive=True))
+    # max() keeps a single running best instead of building and sorting the whole file list
+    latest = max(
+        (info.path for info in infos if info.type == fs.FileType.File and info.extension == suffix.lstrip(".")),
+        default=None,
+    )
+    return Path(latest) if latest is not None else None
+
+def latest_file(table_dir: Path) -> Path:
+    # parquet is preferred; csv is the fallback for environments that wrote bronze without parquet deps
+    if not table_dir.is_dir():
+        raise FileNotFoundError(f"No files found in {table_dir}")
+    mtime_ns = table_dir.stat().st_mtime_ns
+    latest = _latest(str(table_dir), ".parquet", mtime_ns) or _latest(str(table_dir), ".csv", mtime_ns)
+    if latest is None:
+        raise FileNotFoundError(f"No parquet or csv files found in {table_dir}")
+    return latest
+
+# read_table loads a tier file straight into an Arrow table (no pandas block manager in between), so
+# silver_clean.py and gold_features.py can pass pa.Table objects from read to write.
+# columns= only decodes the listed columns (projection pushdown), and filters= takes a pyarrow.dataset
+# expression (eg: pc.field("date") >= cutoff) that lets parquet skip whole row groups from their min/max stats.
+def read_table(path: Path, columns: list[str] | None = None, filters: pc.Expression | None = None) -> pa.Table:
+    if path.suffix == ".parquet":
+        return pq.read_table(path, columns=columns, filters=filters)
+    # csv fallback for older bronze files; include_columns is pyarrow's equivalent of usecols
+    convert_options = pacsv.ConvertOptions(include_columns=columns) if columns else None
+    tbl = pacsv.read_csv(path, convert_options=convert_options)
+    return tbl.filter(filters) if filters is not None else tbl
+
+# Parquet writer options passed to pyarrow.parquet.write_table.
+# - zstd at level 3 gives smaller files than the snappy default at similar decode speed
+# - row groups of ~64k rows keep per-group min/max stats useful for skipping data on read
+# - dictionary encoding stores repeated strings (eg: the constant source_type column) once per row group
+PYARROW_WRITE_OPTIONS = {
+    "compression": "zstd",
+    "compression_level": 3,
+    "row_group_size": 65_536,
+    "use_dictionary": True,
+}
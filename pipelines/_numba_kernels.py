@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import numpy as np
+
+# The purpose here is to hold Numba-compiled kernels for hot loops in the feature pipelines (notebooks/gold_features.py).
+# Numba compiles plain Python loops over NumPy arrays into machine code, so an O(N) online algorithm
+# beats the O(N*W) work of re-scanning every window.
+
+# numba is an optional dependency: if it isn't installed, njit becomes a no-op decorator so the module still imports,
+# and callers check NUMBA_AVAILABLE to decide whether to dispatch here or use their NumPy/pandas path.
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Series longer than this are routed to the compiled kernel; shorter ones aren't worth the first-call compile.
+NUMBA_MIN_ROWS = 10_000
+
+# cache=True writes the compiled machine code to __pycache__ so later processes skip recompiling.
+# fastmath is left off on purpose: it lets LLVM assume no NaNs, which would break the np.isfinite checks below.
+@njit(cache=True)
+def rolling_std_fixed(x: np.ndarray, w: int) -> np.ndarray:
+    # Sample (ddof=1) rolling std over a fixed window w, matching pandas' .rolling(w).std().
+    # Welford's online variance: keep a running mean and M2 (sum of squared deviations from the mean),
+    # add the entering value and remove the leaving one with the inverse update, so each step is O(1).
+    n = len(x)
+    out = np.full(n, np.nan)
+    nobs = np.int64(0) # int64 so the count can't overflow on very long series
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        # add the value entering the window
+        x_in = x[i]
+        if np.isfinite(x_in):
+            nobs += 1
+            delta = x_in - mean
+            mean += delta / nobs
+            m2 += delta * (x_in - mean)
+
+        # remove the value leaving the window (inverse Welford update)
+        if i >= w:
+            x_out = x[i - w]
+            if np.isfinite(x_out):
+                nobs -= 1
+                if nobs == 0:
+                    mean = 0.0
+                    m2 = 0.0
+                else:
+                    delta = x_out - mean
+                    mean -= delta / nobs
+                    m2 -= delta * (x_out - mean)
+
+        # a window is only valid once it holds w finite values (pandas' default min_periods=window)
+        if nobs == w and w > 1:
+            out[i] = np.sqrt(max(m2, 0.0) / (w - 1))
+    return out
@@ -3,51 +3,69 @@ from __future__ import annotations
 from pathlib import Path # path object for platform-safe paths
 from typing import Tuple # Tuple type hint
 
+import numpy as np
 import pandas as pd
 
+# pyarrow is required: bronze is always written as parquet. Checking once at import gives a clear error up front,
+# instead of a broad except silently degrading every write to (much slower to load) csv.
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError as exc:
+    raise ImportError("pyarrow is required to write bronze parquet files (pip install pyarrow)") from exc
+
+from pipelines._io import PYARROW_WRITE_OPTIONS
+
 # The purpose here is to have a shared writer for all bronze tables used by pipelines/bronze/*.py.
 # Centralizing write logic keeps ingestion scripts minimal and consistent.
 
-# The function write_bronze() takes a df and a table name to ingest and store data as a type parquet or csv.
+# The function write_bronze() takes a df and a table name to ingest and store data as parquet.
 # We include an 'ingested_at' timestamp column for auditability.
-# We create two paths: parquet and csv, one as a preferred format and the other as a fallback.
 
 # Walkthrough Step 2:
 # Create a single writer utility so all ingestion jobs store data with the same 
 # file naming, schema, and audit fields.
 
+# Shared dtype for the source_type tag set by eia_prices.py, eia_supply.py, eia_storage.py.
+# A categorical stores each row as a small integer code plus one copy of each label, and parquet writes it
+# as a dictionary-encoded column, so the constant tag costs almost nothing on disk or in memory.
+SOURCE_TYPE_DTYPE = pd.CategoricalDtype(["prices", "supply", "storage"])
+
 # This part (bronze_writer.py) is imported and used by pipelines/bronze/eia_prices.py, eia_storage.py, eia_supply.py, etc.
 
 def write_bronze(df: pd.DataFrame, table_name: str, output_root: str = "data/bronze") -> Tuple[str, str]:
-    # Timestamp used to version the output file and keep writes append-only. 
+    # Read the clock once: the same instant versions the output file and stamps ingested_at.
     # pd.Timestamp.utcnow() returns a timezone-neutral UTC timestamp
-    timestamp = pd.Timestamp.utcnow().strftime("%Y%m%dT%H%M%SZ") # .strftime formats the timestamp to a string like "20240105T153045Z"
-    df = df.copy() # avoid mutating the input df passed by callers
-    df['ingested_at'] = pd.Timestamp.utcnow() # add load time for auditability
-    
+    now = pd.Timestamp.utcnow()
+    # Timestamp used to version the output file and keep writes append-only. 
+    timestamp = now.strftime("%Y%m%dT%H%M%SZ") # .strftime formats the timestamp to a string like "20240105T153045Z"
+    # load time for auditability; it is appended as an Arrow column below, so the caller's df is never mutated or copied
+    ingested_at = now
+
     # Recall, Path(...) builds a platform-safe path object; "/" joins subpaths
     # That is, Path(...) builds a path object; "/" joins subpaths across platforms
     output_dir = Path(output_root) / table_name # this has type Path which is like a string but safer
     output_dir.mkdir(parents=True, exist_ok= True) # create folders if missing, parents=True makes parent dirs as needed, and exist_ok=True avoids error if dir already exists
 
-    # making parquet and csv paths
     parquet_path = output_dir/f"{timestamp}.parquet"
-    csv_path = output_dir/f"{timestamp}.csv"
-
-    try:
-
-        # parquet is preferred over csv for size/speed, but requires optional dependencies
-        # df.to_parquet writes columnar storage; index=False omits row index
-        df.to_parquet(parquet_path, index = False)
 
-        return str(parquet_path), "parquet" # return the path as a string and the format
-        # ie: we converted df to parquet then returned the path for where we wrote it
+    # Table.from_pandas converts the df to Arrow columns; preserve_index=False omits the row index.
+    # Appending ingested_at on the Arrow side avoids df.copy(), which would clone the whole frame for one column.
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    # ingested_at is the same for every row, so build it as a dictionary column: a single timestamp value plus
+    # 1-byte int8 codes (all 0) instead of 8 bytes per row. Parquet writes it as one dictionary entry with
+    # run-length encoded codes, and readers still get back a plain timestamp column.
+    ts_col = pa.DictionaryArray.from_arrays(
+        pa.array(np.zeros(len(df), dtype=np.int8)),
+        pa.array([ingested_at], type=pa.timestamp("ns", tz="UTC")),
+    )
+    table = table.append_column("ingested_at", ts_col)
+    # also record it once in the file's key-value metadata, readable without scanning any rows
+    metadata = {**(table.schema.metadata or {}), b"ingested_at": ingested_at.isoformat().encode()}
+    table = table.replace_schema_metadata(metadata)
 
-    except Exception: # the fallback
-        # fallback to csv keeps pipeline runnable in minimal environments
-        # df.to_csv writes plain text csv for environments lacking parquet deps
-        df_to_csv(csv_path, index = False)
-        return str(csv_path), "csv" # return the path as a string and the format
-        # ie: we converted df to csv then returned the path for where we wrote it
-    
+    # PYARROW_WRITE_OPTIONS selects zstd compression, ~64k-row row groups, and dictionary encoding
+    pq.write_table(table, parquet_path, **PYARROW_WRITE_OPTIONS)
 
+    return str(parquet_path), "parquet" # return the path as a string and the format
+    # ie: we converted df to parquet then returned the path for where we wrote it
@@ -2,8 +2,8 @@ import os
 
 import pandas as pd
 
-from pipelines.bronze._bronze_writer import write_bronze
-from src.io.eia_client import fetch_series, series_to_frame
+from pipelines.bronze._bronze_writer import SOURCE_TYPE_DTYPE, write_bronze
+from src.io.eia_client import cached_fetch_series
 
 wti_spot_series = "PET.RWTC.D" # this is the EIA series ID for WTI spot prices, "PET" means petroleum, "RWTC" means regular WTI crude, "D" means daily
 
@@ -23,11 +23,11 @@ wti_spot_series = "PET.RWTC.D" # this is the EIA series ID for WTI spot prices,
 
 def load_prices(api_key: str | None = None) -> pd.DataFrame: # recall, | None = None means the arg is optional
     # fetch raw series JSON and convert into a tidy 3-column df.
-    # we use fetch_series to hit the EIA API and return a dict payload for this series_id
-    series = fetch_series(wti_spot_series, api_key=api_key)
-    df = series_to_frame(series)
+    # we use cached_fetch_series to hit the EIA API (or the local parquet cache) and get back a tidy df for this series_id
+    df = cached_fetch_series(wti_spot_series, api_key=api_key)
     # tagging the source_type lets downstream dispatch choose feature logic
-    df["source_type"] = "prices"
+    # value already arrives as float32 from series_to_frame; source_type is categorical (see SOURCE_TYPE_DTYPE)
+    df = df.assign(source_type=pd.Categorical(["prices"] * len(df), dtype=SOURCE_TYPE_DTYPE))
     return df
 
 def main() -> None:
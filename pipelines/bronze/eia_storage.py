@@ -6,8 +6,8 @@ import os
 
 import pandas as pd
 
-from pipelines.bronze._bronze_writer import write_bronze
-from src.io.eia_client import fetch_series, series_to_frame
+from pipelines.bronze._bronze_writer import SOURCE_TYPE_DTYPE, write_bronze
+from src.io.eia_client import cached_fetch_series
 
 crude_inventory_series = "PET.WCESTUS1.W"  # EIA series ID for US crude oil inventories, "PET"=petroleum, "WCESTUS1"=weekly US crude inventory, "W"=weekly
 
@@ -17,12 +17,12 @@ crude_inventory_series = "PET.WCESTUS1.W"  # EIA series ID for US crude oil inve
 
 def load_storage(api_key: str | None = None) -> pd.DataFrame: # recall, | None = None means the arg is optional
     # weekly US crude inventory levels for storage dynamics
-    # fetch_series hits the EIA API and returns a dict payload for this series_id 
-    series = fetch_series(crude_inventory_series, api_key=api_key)
-    df = series_to_frame(series)
+    # cached_fetch_series hits the EIA API (or the local parquet cache) and returns a tidy df for this series_id
+    df = cached_fetch_series(crude_inventory_series, api_key=api_key)
 
     # source_type labels help route the data to the correct feature logic
-    df["source_type"] = "storage"
+    # value already arrives as float32 from series_to_frame; source_type is categorical (see SOURCE_TYPE_DTYPE)
+    df = df.assign(source_type=pd.Categorical(["storage"] * len(df), dtype=SOURCE_TYPE_DTYPE))
     return df
 
 def main() -> None:
@@ -6,8 +6,8 @@ import os
 
 import pandas as pd
 
-from pipelines.bronze._bronze_writer import write_bronze
-from src.io.eia_client import fetch_series, series_to_frame
+from pipelines.bronze._bronze_writer import SOURCE_TYPE_DTYPE, write_bronze
+from src.io.eia_client import cached_fetch_series
 
 us_crude_production_series = "PET.MCRFPUS2.W"  # EIA series ID for US crude oil production, "PET"=petroleum, "MCRFPUS2"=weekly US crude production, "W"=weekly
 
@@ -20,9 +20,9 @@ def load_supply(api_key: str | None = None) -> pd.DataFrame:
     # weekly US crude production series for supply leg of the model
     
     # as before, we have:
-    series = fetch_series(us_crude_production_series, api_key=api_key)
-    df = series_to_frame(series)
-    df["source_type"] = "supply"
+    df = cached_fetch_series(us_crude_production_series, api_key=api_key)
+    # value already arrives as float32 from series_to_frame; source_type is categorical (see SOURCE_TYPE_DTYPE)
+    df = df.assign(source_type=pd.Categorical(["supply"] * len(df), dtype=SOURCE_TYPE_DTYPE))
 
     return df
 
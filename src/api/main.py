@@ -1,6 +1,9 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from src.api.routes import router
+from src.db.session import dispose_async_engine
 
 # Walkthrough Step 10: 
 # We provide a single ASGI entrypoint for deployment (Uvicorn/Gunicorn).
@@ -11,8 +14,15 @@ from src.api.routes import router
 # It wires together the routes defined in src/api/routes.py into a FastAPI app instance.
 # Keeps startup minimal so ASGI servers can import the app quickly.
 
+# lifespan runs once around the app's lifetime: code after `yield` runs on shutdown.
+# Disposing the async engine closes its pooled asyncpg connections cleanly instead of leaving them to time out.
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await dispose_async_engine()
+
 # FastAPI() constructs the ASGI application object used by Uvicorn/Gunicorn.
-app = FastAPI(title="Oil Regime API", version = "0.1.0")
+app = FastAPI(title="Oil Regime API", version = "0.1.0", lifespan = lifespan)
 
 # Routes are defined in src/api/routes.py and wired here.
 # This file is intentionally small so app creation is isolated for ASGI servers.
@@ -14,20 +14,26 @@
 
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import desc, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # recall, Forecast, GoldFeature, RegimeState are ORM models defined in src/db/models.py
 # Forecast is the table for model forecasts
 # RegimeState is the table for regime data
 # GoldFeature is the table for gold features
-from src.db.models import Forecast, GoldFeature, RegimeState
+from src.db.models import COMMODITIES, Forecast, GoldFeature, RegimeState
 
-# recall, get_session is the dependency that provides a DB session per request
+# recall, get_session is the dependency that provides an async DB session (AsyncSession) per request
 from src.db.session import get_session
 
 # APIRouter groups endpoints so main.py can include them at once
 router = APIRouter()
 
+# commodity is a Postgres ENUM, so comparing it with an unknown label is an error rather than "no rows";
+# answer those with a 404 before touching the database
+def _check_commodity(commodity: str) -> None:
+    if commodity not in COMMODITIES:
+        raise HTTPException(status_code=404, detail=f"Unknown commodity: {commodity}")
+
 @router.get("/health")
 def health() -> dict:
     # sanity status check endpoint used by deploys and local checks
@@ -35,8 +41,9 @@ def health() -> dict:
 
 # ie: what get_regime does is: pull the most recent regime record for this commodity
 @router.get("/regime/{commodity}")
-def get_regime(commodity: str, session: Session = Depends(get_session)) -> dict:
+async def get_regime(commodity: str, session: AsyncSession = Depends(get_session)) -> dict:
     # ie: Depends(get_session) injects a DB session created in src/db/session.py.
+    _check_commodity(commodity)
     # select() builds a SQLAlchemy Select object (not executed yet).
 
     # Pull the most recent regime record for this commodity.
@@ -48,8 +55,8 @@ def get_regime(commodity: str, session: Session = Depends(get_session)) -> dict:
     )
 
     # recall, execute() runs the SQL; scalar_one_or_none() unwraps a single ORM row or None.
-    # session.execute() sends SQL to the DB; scalar_one_or_none() unwraps one row.
-    row = session.execute(query).scalar_one_or_none()
+    # await session.execute() sends SQL to the DB without blocking the event loop; scalar_one_or_none() unwraps one row.
+    row = (await session.execute(query)).scalar_one_or_none()
     if row is None:
         raise HTTPException(status_code=404, detail="No regime data found")
     return {
@@ -61,8 +68,9 @@ def get_regime(commodity: str, session: Session = Depends(get_session)) -> dict:
 
 # ie: what get_signals does is: return the last N features for the commodity
 @router.get("/signals/{commodity}")
-def get_signals(commodity: str, limit: int = 52, session: Session = Depends(get_session)) -> dict:
+async def get_signals(commodity: str, limit: int = 52, session: AsyncSession = Depends(get_session)) -> dict:
     # return the last N features for the commodity
+    _check_commodity(commodity)
     
     # recall, select() builds a SQL statement, session.execute runs it.
     # select() + where/order_by/limit forms the SQL query for recent features.
@@ -75,7 +83,7 @@ def get_signals(commodity: str, limit: int = 52, session: Session = Depends(get_
 
     # recall, scalars() turns Row objects into model instances; all() materializes the list.
     # scalars() unwraps ORM objects; all() materializes a list in memory.
-    rows = session.execute(query).scalars().all()
+    rows = (await session.execute(query)).scalars().all()
     if not rows:
         raise HTTPException(status_code = 404, detail = "No signals found")
     return {
@@ -92,8 +100,9 @@ def get_signals(commodity: str, limit: int = 52, session: Session = Depends(get_
 
 # ie: what get_forecast does is: retrieve the most recent forecast for a given commodity and horizon_weeks
 @router.get("/forecasts/{commodity}")
-def get_forecast(commodity: str, horizon_weeks: int = 4, session: Session = Depends(get_session)) -> dict:
+async def get_forecast(commodity: str, horizon_weeks: int = 4, session: AsyncSession = Depends(get_session)) -> dict:
     # select most recent forecast for a horizon
+    _check_commodity(commodity)
     # The filter includes both commodity and horizon_weeks to get the right forecast.
     # This query filters by commodity AND horizon_weeks, then takes the latest week.
     query = (
@@ -105,7 +114,7 @@ def get_forecast(commodity: str, horizon_weeks: int = 4, session: Session = Depe
         .order_by(desc(Forecast.week))
         .limit(1)
     )
-    row = session.execute(query).scalar_one_or_none() # recall execute() runs SQL; scalar_one_or_none() unwraps single ORM row or None
+    row = (await session.execute(query)).scalar_one_or_none() # recall execute() runs SQL; scalar_one_or_none() unwraps single ORM row or None
     if row is None:
         raise HTTPException(status_code=404, detail = "No forecast found")
     return {
@@ -12,10 +12,18 @@
 
 from datetime import datetime
 
-from sqlalchemy import Date, DateTime, Float, Integer, String
+from sqlalchemy import Date, DateTime, Enum, Float, Index, Integer, String, func, text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
+# The commodities we serve. In Postgres, commodity is a native ENUM: each row stores a 4-byte reference to a label
+# instead of repeating a VARCHAR(32) string, which narrows every row and every index that leads with commodity.
+# All three tables share this one type object, so create_all emits CREATE TYPE commodity_enum once.
+# (notebooks/gold_to_postgres.py builds its pandas Categorical from the same tuple)
+COMMODITIES = ("wti", "brent", "natgas", "gasoline", "diesel")
+CommodityEnum = Enum(*COMMODITIES, name="commodity_enum")
+
+
 class Base(DeclarativeBase):
     # Declarative base shared by all ORM models in this project.
     # This keeps table metadata centralized for migrations/DDL.
@@ -24,16 +32,25 @@ class Base(DeclarativeBase):
 
 class GoldFeature(Base):
     __tablename__ = 'gold_features'
+    # /signals/{commodity} filters by commodity and reads the newest weeks first, so one composite btree
+    # on (commodity, week DESC) answers it by walking the first N index entries for that commodity.
+    # It also covers plain commodity lookups (leading column), so commodity needs no index of its own.
+    __table_args__ = (
+        Index("ix_gold_features_commodity_week_desc", "commodity", text("week DESC")),
+    )
 
     # !! - the following are: ORM mapped attributes will contain a specific type of object
 
     # Mapped[...] tells SQLAlchemy this is an ORM-mapped attribute.
     # Integer maps to a SQL INTEGER type for primary keys.
     id: Mapped[int] = mapped_column(Integer, primary_key = True, autoincrement = True)
-    # String(32) maps to VARCHAR(32); index = True asks the database (db) to index this column
-    commodity: Mapped[str] = mapped_column(String(32), index = True)
-    # Date maps to a date-only column (w/ no time component)
-    week: Mapped[datetime] = mapped_column(Date, index = True)
+    # CommodityEnum maps to the commodity_enum type; indexed through the composite index in __table_args__
+    commodity: Mapped[str] = mapped_column(CommodityEnum)
+    # Date maps to a date-only column (w/ no time component).
+    # No index of its own: every route filters by commodity first, so the composite index covers week, and each
+    # extra btree would be one more index write on every insert.
+    # (databases created before this change still have ix_<table>_week; drop it with DROP INDEX IF EXISTS)
+    week: Mapped[datetime] = mapped_column(Date)
 
     # These have downstream uses in: /signals/{commodity} route in src/api/routes.py
     # Each row is one feature/value for one week
@@ -42,16 +59,21 @@ class GoldFeature(Base):
     feature_name: Mapped[str] = mapped_column(String(128), index = True)
     # Float maps to a floating-point numeric column for feature values
     feature_value: Mapped[float] = mapped_column(Float)
-    # DateTime maps to a timestamp; default supplies a value on insert
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now((datetime.timezone.utc)))
+    # DateTime(timezone=True) maps to a timestamptz column; server_default=func.now() has Postgres fill it in on
+    # insert (evaluated per insert, unlike a Python default computed once at import), so bulk loads send no value
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
 
 class RegimeState(Base): 
     __tablename__ = 'regime_states'
+    # /regime/{commodity} takes the latest week for one commodity: the first entry of this index
+    __table_args__ = (
+        Index("ix_regime_states_commodity_week_desc", "commodity", text("week DESC")),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key = True, autoincrement = True)
-    commodity: Mapped[int] = mapped_column(String(32), index = True)
-    week: Mapped[datetime] = mapped_column(Date, index = True)
+    commodity: Mapped[str] = mapped_column(CommodityEnum)
+    week: Mapped[datetime] = mapped_column(Date) # covered by the composite index above
 
     # Latest value is served by /regime/{commodity}
     # regime_label is a string-like 'tight-suply' or 'risk_off'
@@ -59,15 +81,19 @@ class RegimeState(Base):
     regime_label: Mapped[str] = mapped_column(String(64), index = True)
     # Float type with nullable = True allows for missing score; Mapped[float | None] matches that
     regime_score: Mapped[float|None] = mapped_column(Float, nullable=True)
-    # again, DateTime maps to a timestamp; default supplies a value on insert
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now((datetime.timezone.utc)))
+    # again, a timestamptz filled in by Postgres on insert
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
 class Forecast(Base):
     __tablename__ = 'forecasts'
+    # /forecasts/{commodity} filters by commodity and horizon_weeks, then takes the latest week
+    __table_args__ = (
+        Index("ix_forecasts_commodity_horizon_week_desc", "commodity", "horizon_weeks", text("week DESC")),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key = True, autoincrement = True)
-    commodity: Mapped[str] = mapped_column(String(32), index = True)
-    week: Mapped[datetime] = mapped_column(Date, index = True)
+    commodity: Mapped[str] = mapped_column(CommodityEnum)
+    week: Mapped[datetime] = mapped_column(Date) # covered by the composite index above
 
     # Integer stores horizon in weeks for easy filtering and ordering
     horizon_weeks: Mapped[int] = mapped_column(Integer, index = True)
@@ -75,5 +101,5 @@ class Forecast(Base):
     # /forecast/{commodity} returns the most recent matching horizon
     # horizon_weeks let's us store multiple horizons in one table
     forecast_value: Mapped[Float] = mapped_column(Float)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now((datetime.timezone.utc)))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
@@ -1,4 +1,5 @@
-# The purpose of this file is to centralize db connectivity for API routes in src/api/routes.py
+# The purpose of this file is to centralize db connectivity for API routes in src/api/routes.py (async)
+# and for the pipeline loaders in notebooks/ (sync).
 # This would isolate connection details and keep per-request sessions consistent. 
 # ie: provide reliable db sessions to API route handlers without leaking connections.
 
@@ -6,36 +7,135 @@
 # We create a reusable db session factory so the API can safely access PostgreSQL without 
 # opening/closing connections manually per query.
 
+import io
 import os
-from typing import Generator
+import threading
+from typing import AsyncIterator
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+import pandas as pd
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 def _build_database_url() -> str:
-    # reads db_url from the environment so the API can point at dev/prod PostgreSQL without changing code
+    # reads DB_URL from the environment so the API can point at dev/prod PostgreSQL without changing code
     # os.getenv fetches environment variables; returns None if missing
-    url = os.getenv('db_url')
+    url = os.getenv('DB_URL')
     if not url:
-        raise ValueError("db_url is required for database access")
+        raise ValueError("DB_URL is required for database access")
     return url
 
-# Create a SQLAlchemy Engine once. It manages connection pooling internally. 
-# create_engine creates the database connection pool and DBAPI/database api adapter
-engine = create_engine(_build_database_url(), pool_pre_ping = True)
+def _build_async_database_url() -> str:
+    # same database, but through the asyncpg driver: eg: postgresql+psycopg2://... -> postgresql+asyncpg://...
+    # make_url parses the URL so only the driver part changes (credentials/host/db stay as-is)
+    return make_url(_build_database_url()).set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+
+# Engines are built lazily, on first use, instead of at import: importing this module (or models, or a pipeline
+# that never touches Postgres) then needs no DB_URL and doesn't pay for engine construction.
+# Both getters are the double-checked locking singleton: the unlocked check keeps the common path lock-free, and
+# the second check inside the lock stops two threads racing on first use from building two pools.
+_engine: Engine | None = None
+_async_engine: AsyncEngine | None = None
+_engine_lock = threading.Lock()
+
+# Pool sizing: pool_size connections stay open, and up to max_overflow extra ones are opened under bursts, so the API
+# can serve ~30 concurrent route handlers before requests queue (for up to pool_timeout seconds).
+# Keep (pool_size + max_overflow) x number of workers below Postgres' max_connections; dev can shrink both via env.
+# pool_recycle replaces connections older than 30 min before the server or a proxy drops them as stale.
+def _pool_options() -> dict:
+    return {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "20")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        "pool_timeout": 30,
+        "pool_recycle": 1800,
+        "pool_pre_ping": True,
+    }
+
+def get_engine() -> Engine:
+    # The SQLAlchemy Engine for pipeline code. It manages connection pooling internally.
+    # create_engine creates the database connection pool and DBAPI/database api adapter
+    # insertmanyvalues_page_size batches executemany INSERTs into multi-row VALUES statements of 1000 rows each
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = create_engine(_build_database_url(), insertmanyvalues_page_size = 1000, **_pool_options())
+    return _engine
+
+# A central session factory for pipeline code (eg: notebooks/gold_to_postgres.py) that runs synchronously
+# SessionLocal creates a short-lived/temporary db session; it isn't bound to an engine at import,
+# so pass one in: SessionLocal(bind=get_engine())
+SessionLocal = sessionmaker(autocommit=False, autoflush= False) 
+
+# Bulk writes for pipeline code: insert(model) is a Core INSERT, and passing a list of dicts makes SQLAlchemy run
+# it as an executemany, which 2.0's "insertmanyvalues" batches into multi-row INSERT ... VALUES statements
+# (insertmanyvalues_page_size rows each). Unlike session.add_all([Model(...), ...]) it builds no ORM objects
+# and skips the unit-of-work flush, so rows go straight from dicts to the driver.
+# (The async equivalent is `await session.execute(insert(model), rows)` on an AsyncSession.)
+def bulk_insert(session: Session, model: type[DeclarativeBase], rows: list[dict]) -> None:
+    if rows: # an empty executemany is an error, and there's nothing to write anyway
+        session.execute(insert(model), rows)
 
-# A central sesison factory used by the API dependency in src/api/routes.py
-# SessionLocal creates a short-lived/temporary db session per request
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush= False) 
+# For large loads (eg: weekly gold materialization), even batched INSERTs spend most of their time in SQL parsing.
+# Postgres COPY ... FROM STDIN skips the parser and streams rows in one command. Below ~COPY_MIN_ROWS rows
+# bulk_insert is just as fast and works on any database, so callers only switch to COPY above it.
+COPY_MIN_ROWS = 5000
+COPY_DRIVERS = ("psycopg2", "psycopg") # the DBAPI drivers copy_dataframe knows how to COPY through
 
-def get_session() -> Generator[Session, None, None]:
+def copy_dataframe(
+    session: Session, table: str, df: pd.DataFrame, columns: list[str], types: list[str] | None = None
+) -> None:
+    # Runs on the session's own connection, so the COPY commits or rolls back with the rest of the session.
+    # Columns left out of `columns` (eg: id, created_at) get their server-side defaults.
+    driver = session.get_bind().dialect.driver
+    raw = session.connection().connection.driver_connection # the underlying DBAPI connection
+    column_list = ", ".join(columns)
+
+    if driver == "psycopg":
+        # psycopg 3: with Postgres type names for each column, use the binary wire format (no text parsing on
+        # the server); without them, text format lets psycopg adapt each Python value itself.
+        fmt = " (FORMAT BINARY)" if types else ""
+        with raw.cursor() as cur, cur.copy(f"COPY {table} ({column_list}) FROM STDIN{fmt}") as copy:
+            if types:
+                copy.set_types(types)
+            for row in df[columns].itertuples(index=False, name=None):
+                copy.write_row(row)
+    elif driver == "psycopg2":
+        # psycopg2 only copies from a file-like object, so stream an in-memory CSV
+        # (NaN becomes an empty field, which COPY reads as NULL)
+        buf = io.StringIO()
+        df[columns].to_csv(buf, index=False, header=False)
+        buf.seek(0) # rewind so copy_expert reads from the start
+        with raw.cursor() as cur:
+            cur.copy_expert(f"COPY {table} ({column_list}) FROM STDIN WITH (FORMAT CSV)", buf)
+    else:
+        raise ValueError(f"COPY is not supported for the {driver} driver; use bulk_insert instead")
+
+# The API uses an async engine instead: with asyncpg (binary protocol) and AsyncSession, route handlers await
+# their queries on the event loop, so many requests can be in flight at once without each one holding
+# a threadpool worker for the duration of its query. Same pool sizing and lazy setup as get_engine.
+def get_async_engine() -> AsyncEngine:
+    global _async_engine
+    if _async_engine is None:
+        with _engine_lock:
+            if _async_engine is None:
+                _async_engine = create_async_engine(_build_async_database_url(), **_pool_options())
+    return _async_engine
+
+async def dispose_async_engine() -> None:
+    # close the async pool's connections on shutdown (a no-op if nothing ever used the database)
+    if _async_engine is not None:
+        await _async_engine.dispose()
+
+# A central session factory used by the API dependency below
+# expire_on_commit=False keeps loaded attributes readable after commit without another (awaited) round-trip
+AsyncSessionLocal = async_sessionmaker(expire_on_commit=False)
+
+async def get_session() -> AsyncIterator[AsyncSession]:
     # Note that FastAPI depends on this generator to open/close db sessions per request
-    # SessionLocal() returns a Session object tied to the Engine's connection pool
-    # It does not open a connection until the first query is executed
-    session = SessionLocal()
-    try: 
+    # AsyncSessionLocal() returns an AsyncSession tied to the async engine's connection pool (built on first request)
+    # It does not open a connection until the first query is awaited
+    async with AsyncSessionLocal(bind=get_async_engine()) as session: # async with always closes, even if the route raises something
         yield session # yields control back to the route handler
-    finally:
-        session.close() # always closes, even if the route raises something
-
-        
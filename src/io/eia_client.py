@@ -1,10 +1,53 @@
-import json
+import asyncio
+import hashlib
+import itertools
 import os
-from typing import Dict, List
-from urllib.parse import urlencode
-from urllib.request import urlopen
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+# orjson parses JSON from bytes in C, several times faster than the stdlib on EIA's long numeric payloads.
+# It's optional: without it we fall back to json.loads, which also accepts bytes (no .decode step either way).
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# httpx (installed with the http2 extra, which brings h2) is optional too: when present, every fetch goes over
+# a single HTTP/2 connection that multiplexes concurrent requests as streams, instead of one pooled connection each.
+try:
+    import httpx
+    import h2 # noqa: F401 (httpx needs h2 for http2=True)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# ijson (optional) parses JSON incrementally from a file-like object. For very large payloads (eg: decades of daily
+# data) we stream just the data rows out of the socket instead of holding the whole body and its parsed tree at once.
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Bodies bigger than this once decompressed are stream-parsed when ijson is installed; smaller ones are faster to read
+# whole and parse in C with orjson. (Content-Length can't decide it: with gzip it's the compressed size, and chunked
+# responses don't send one, so the body is measured as it arrives instead; see _fetch_series_remote.)
+stream_min_bytes = int(os.getenv("EIA_STREAM_MIN_BYTES", str(4 * 1024 * 1024)))
 
 # The purpose here is to fetch raw EIA time series and convert them into a clean dataframe
 # for the bronze ingestion scripts in the pipelines/bronze/*.py files, which then write to storage.
@@ -20,25 +63,253 @@ base_url = "https://api.eia.gov/series/" # note that error encountered is fine a
 # so we'll build out urls based on what we need. Our project specifically uses oil prices, storage levels, and supply data. 
 # Hence, we'll have eia_prices.py, eia_storage.py, eia_supply.py files in the io/ directory
 
-def fetch_series(series_id: str, api_key: str | None = None) -> Dict[str, List[List[str]]]:
-    if api_key is None:
-        api_key = os.getenv("EIA_API_KEY") # env lookup returns None if unset
-    if not api_key:
-        raise ValueError("EIA_API_KEY is required")
-    
-    # urlencode() builds the query string like "api_key=...&series_id=..."
-    query = urlencode({"api_key": api_key, "series_id": series_id})
-    url = f"{base_url}?{query}"
-    with urlopen(url) as response:
-        payload = json.loads(response.read().decode("utf-8")) # the reason why we use utf-8 is because the API returns data in utf-8 encoding.
-    
+# EIA's v2 API serves the same data by route (eg: petroleum/pri/spt for spot prices) and can return many series
+# from one route in a single request; see fetch_series_batch below.
+v2_base_url = "https://api.eia.gov/v2/"
+
+# Parsed series are cached on disk as parquet (see cached_fetch_series below), so reruns during development
+# (eg: while iterating on silver/gold) read a local file instead of making an HTTPS round-trip.
+# EIA_CACHE_DIR moves the cache, EIA_CACHE_TTL sets how long an entry stays fresh (eg: "24h", "7d"),
+# and EIA_NOCACHE=1 bypasses it entirely.
+cache_dir = Path(os.getenv("EIA_CACHE_DIR", Path.home() / ".cache" / "eia"))
+default_cache_ttl = os.getenv("EIA_CACHE_TTL", "24h")
+
+# Responses worth retrying: rate limiting and transient server errors
+_retry_statuses = (429, 500, 502, 503, 504)
+# Seconds to wait before each retry of the httpx path: exponential like the Session's Retry(backoff_factor=0.3),
+# with one retry per entry (so 1 attempt + 3 retries). There is no wait after the last attempt.
+_retry_backoff = (0.3, 0.6, 1.2)
+
+# One shared requests.Session for every fetch: urllib3's connection pool keeps the TCP+TLS connection to api.eia.gov
+# alive between calls, so fetching several series back-to-back pays the handshake once instead of per series.
+# The adapter also retries transient failures (rate limiting, 5xx) with exponential backoff.
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4, # number of hosts to keep pools for (we only talk to api.eia.gov)
+        pool_maxsize=16, # connections kept per host, enough for concurrent fetches from threads
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=_retry_statuses),
+    ),
+)
+# EIA's JSON (repeated keys, numeric strings) compresses several-fold, so ask for a compressed body explicitly.
+# make_headers(accept_encoding=True) lists every encoding urllib3 can decode here: gzip and deflate always, plus
+# br/zstd when the optional brotli/zstandard packages are installed. Advertising only those means the body is always
+# decodable; requests decompresses it transparently for .content (and ijson streaming sets decode_content).
+_session.headers.update({**make_headers(accept_encoding=True), "Accept": "application/json"})
+
+# With httpx available (it's in requirements.txt; the Session stays as the fallback), one shared HTTP/2 client
+# replaces the Session above: concurrent fetches (eg: the threads in fetch_series_many) interleave as streams
+# on one TCP+TLS connection, so they aren't capped by a pool size and one slow response doesn't hold up the rest. The transport retries failed connects; status retries are in _get.
+# Like the async client below, it's built on first use and dropped by close_session(), so a fetch after close
+# (eg: a second job in the same process) gets a fresh client instead of a closed one.
+# The lock keeps concurrent first calls (eg: fetch_series_many's threads) from each building their own.
+_http2_client = None
+_http2_client_lock = threading.Lock()
+
+def _get_http2_client():
+    global _http2_client
+    with _http2_client_lock:
+        if _http2_client is None or _http2_client.is_closed:
+            _http2_client = httpx.Client(
+                http2=True,
+                # httpx negotiates compression itself (gzip/deflate, plus br/zstd when installed), so only Accept is set
+                headers={"Accept": "application/json"},
+                timeout=httpx.Timeout(30.0, connect=5.0), # same (connect, read) budget as the requests path
+                limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+                transport=httpx.HTTPTransport(http2=True, retries=3),
+            )
+        return _http2_client
+
+# The async twin for code running on an event loop (eg: a FastAPI route): awaiting it lets the loop serve other
+# requests while EIA responds, where a blocking call would stall every request on that worker.
+# An AsyncClient's pooled connections belong to the event loop that opened them, so it's created lazily from
+# inside that loop and remembered together with it. A call from a different loop (eg: a second asyncio.run in a
+# script or notebook) or after aclose_session() builds a fresh one.
+# A client left behind by a finished loop can't be closed from the new one; its sockets go with the old loop.
+_async_http2_client = None
+_async_client_loop = None
+
+def _get_async_client():
+    global _async_http2_client, _async_client_loop
+    loop = asyncio.get_running_loop()
+    if _async_http2_client is None or _async_http2_client.is_closed or _async_client_loop is not loop:
+        _async_http2_client = httpx.AsyncClient(
+            http2=True,
+            headers={"Accept": "application/json"},
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+            transport=httpx.AsyncHTTPTransport(http2=True, retries=3),
+        )
+        _async_client_loop = loop
+    return _async_http2_client
+
+def close_session() -> None:
+    # close pooled connections on shutdown (eg: at the end of a job)
+    global _http2_client
+    _session.close() # a requests.Session stays usable after close(); it just reconnects
+    with _http2_client_lock:
+        if _http2_client is not None:
+            _http2_client.close()
+            _http2_client = None
+
+async def aclose_session() -> None:
+    # async counterpart, for code that ran fetch_series_async on its event loop (eg: in its own shutdown hook)
+    global _async_http2_client, _async_client_loop
+    if _async_http2_client is not None:
+        await _async_http2_client.aclose()
+        _async_http2_client = None
+        _async_client_loop = None
+
+def _get(params: Dict[str, str], stream: bool = False, url: str | None = None):
+    # GET url (default: the v1 base_url) with the HTTP/2 client when we have one, otherwise with the requests Session.
+    # Both responses expose .raise_for_status() and .content, so callers don't care which one they got.
+    # stream=True returns once the headers arrive and leaves the body unread, to be consumed with _iter_body.
+    url = url or base_url
+    if not HTTP2_AVAILABLE:
+        # params= builds the query string like "api_key=...&series_id=..."; timeout=(connect, read) in seconds
+        return _session.get(url, params=params, timeout=(5, 30), stream=stream)
+
+    def send():
+        client = _get_http2_client()
+        request = client.build_request("GET", url, params=params)
+        return client.send(request, stream=stream)
+
+    response = send()
+    for delay in _retry_backoff:
+        if response.status_code not in _retry_statuses:
+            break
+        response.close()
+        time.sleep(delay) # only reached when another attempt follows
+        response = send()
+    return response
+
+def _iter_body(response) -> Iterator[bytes]:
+    # the body of a streamed response in decompressed chunks, from either client
+    if not HTTP2_AVAILABLE:
+        return response.iter_content(chunk_size=64 * 1024)
+    return response.iter_bytes()
+
+def _stream_series_data(chunks: Iterable[bytes], series_id: str) -> Dict[str, List[List[str]]]:
+    # Pull only the [date, value] rows of the first series out of the body as it downloads; metadata
+    # (name, units, ...) is skipped without being built into Python objects.
+    # ijson's push interface: each chunk sent into items_coro appends the rows it completes to `rows`.
+    # the prefix walks payload["series"][i]["data"][j]; v1 returns one series per request, so only series[0]
+    # use_float=True yields floats instead of Decimals, which series_to_frame's to_numeric takes as-is
+    rows = ijson.sendable_list()
+    parser = ijson.items_coro(rows, "series.item.data.item", use_float=True)
+    data: List[List[str]] = []
+    for chunk in chunks:
+        parser.send(chunk)
+        data.extend(rows)
+        del rows[:]
+    parser.close() # flushes the end of the document
+    data.extend(rows)
+    return _parse_series({"series": [{"series_id": series_id, "data": data}] if data else []}, series_id)
+
+def _fetch_series_remote(series_id: str, api_key: str) -> Dict[str, List[List[str]]]:
+    response = _get({"api_key": api_key, "series_id": series_id}, stream=True)
+    try:
+        response.raise_for_status() # raise on 4xx/5xx instead of trying to parse an error page
+        # Read the decompressed body chunk by chunk. If it stays under stream_min_bytes, parse it whole with orjson;
+        # once it passes that, hand the buffered chunks plus the rest of the body to ijson, so memory stays near
+        # stream_min_bytes instead of growing with the payload.
+        body = _iter_body(response)
+        chunks: List[bytes] = []
+        size = 0
+        for chunk in body:
+            chunks.append(chunk)
+            size += len(chunk)
+            if IJSON_AVAILABLE and size > stream_min_bytes:
+                return _stream_series_data(itertools.chain(chunks, body), series_id)
+        payload = _json_loads(b"".join(chunks)) # parse the raw body bytes directly (EIA sends utf-8 JSON)
+    finally:
+        response.close() # hands the connection back to the pool even if a streamed body wasn't fully read
+
+    return _parse_series(payload, series_id)
+
+def _parse_series(payload: dict, series_id: str) -> Dict[str, List[List[str]]]:
+    # the v1 response wraps the series in a list; shared by the sync and async fetches
     series_list = payload.get("series", []) # recall, dict.get returns default [] if key missing
 
     if not series_list: # ie: defaulted to []
         raise ValueError(f"No series data returned for {series_id}")
     return series_list[0] # return the first entry in the list
 
-def series_to_frame(series: Dict[str, List[List[str]]]) -> pd.DataFrame:
+def _resolve_api_key(api_key: str | None) -> str:
+    if api_key is None:
+        api_key = os.getenv("EIA_API_KEY") # env lookup returns None if unset
+    if not api_key:
+        raise ValueError("EIA_API_KEY is required")
+    return api_key
+
+def fetch_series(series_id: str, api_key: str | None = None) -> Dict[str, List[List[str]]]:
+    return _fetch_series_remote(series_id, _resolve_api_key(api_key))
+
+async def fetch_series_async(series_id: str, api_key: str | None = None) -> Dict[str, List[List[str]]]:
+    # Same result as fetch_series, awaitable. Without httpx there is no async HTTP client, so the blocking fetch
+    # runs in a worker thread (asyncio.to_thread) and the event loop stays free either way.
+    if not HTTP2_AVAILABLE:
+        return await asyncio.to_thread(fetch_series, series_id, api_key)
+
+    client = _get_async_client()
+    params = {"api_key": _resolve_api_key(api_key), "series_id": series_id}
+    # same status retries and backoff schedule as _get, awaiting the sleep so the loop isn't blocked
+    response = await client.get(base_url, params=params)
+    for delay in _retry_backoff:
+        if response.status_code not in _retry_statuses:
+            break
+        await response.aclose()
+        await asyncio.sleep(delay)
+        response = await client.get(base_url, params=params)
+    response.raise_for_status()
+    return _parse_series(_json_loads(response.content), series_id)
+
+# EIA date strings by length: daily/weekly "2024-01-05" or "20240105", monthly "2024-01" or "202401", annual "2024".
+# Short forms are padded to a full date (first of the month/year) so one strptime format fits each.
+_date_formats = {
+    10: ("", "%Y-%m-%d"),
+    8: ("", "%Y%m%d"),
+    7: ("-01", "%Y-%m-%d"),
+    6: ("01", "%Y%m%d"),
+    4: ("0101", "%Y%m%d"),
+}
+
+# Quarterly periods: v1 "2024Q1", v2 "2024-Q1". Each quarter is rewritten to its first day, like pd.to_datetime does.
+_quarter_starts = {1: "01", 2: "04", 3: "07", 4: "10"}
+
+def _parse_dates_pandas(raw: pa.Array) -> pa.Array:
+    # Slow path for a format not covered above: pd.to_datetime infers it, errors="coerce" -> NaT on bad input.
+    parsed = pd.to_datetime(pd.Series(raw.to_pandas(), dtype=object), errors="coerce")
+    return pa.array(parsed, from_pandas=True).cast(pa.date32())
+
+def _parse_dates(raw: pa.Array) -> pa.Array:
+    # One series has one frequency, so the first date decides the format for the whole column.
+    # pc.strptime parses every string in C; error_is_null=True -> null on bad input (like errors="coerce").
+    valid = raw.drop_null()
+    if not len(valid):
+        return pa.nulls(len(raw), pa.date32())
+    first = valid[0].as_py()
+
+    strings = raw
+    if "Q" in first:
+        for quarter, month in _quarter_starts.items(): # eg: "2024-Q3" -> "2024-07-01"
+            strings = pc.replace_substring_regex(strings, rf"^(\d{{4}})-?Q{quarter}$", rf"\1-{month}-01")
+        pad, fmt = "", "%Y-%m-%d"
+    elif len(first) in _date_formats:
+        pad, fmt = _date_formats[len(first)]
+    else:
+        return _parse_dates_pandas(raw)
+
+    if pad:
+        strings = pc.binary_join_element_wise(strings, pad, "") # eg: "202401" + "01" -> "20240101"
+    dates = pc.strptime(strings, format=fmt, unit="s", error_is_null=True)
+    # the first date has a known length but not the expected layout (eg: "01/05/2024"): let pandas infer it
+    if not dates.filter(raw.is_valid())[0].is_valid:
+        return _parse_dates_pandas(raw)
+    return dates.cast(pa.date32())
+
+def series_to_arrow(series: Dict[str, List[List[str]]]) -> pa.Table:
     # Why Dict[str, List[List[str]]]? Because the series dict has keys that are strings, and the values are lists of lists of strings (the data field).
     # and List[List[str]] represents a list of rows, where each row is a list of strings (date and value).
     # the data field contains rows like ["2024-01-05", 75.12]
@@ -57,19 +328,57 @@ def series_to_frame(series: Dict[str, List[List[str]]]) -> pd.DataFrame:
     # }
     # ie: we are guaranteed to have a "data" field in the series dict 
 
-    # pd.DataFrame builds a table; columns assigns names to each position in data
-    df = pd.DataFrame(data, columns = ["date", "value"]) # converting to df and naming the columns of 'data'
+    # Build Arrow columns directly: pq.write_table can write the result as-is (the parquet cache below does),
+    # and series_to_frame converts it to pandas in one pass, instead of pandas inferring dtypes first
+    # and Arrow re-boxing everything on write.
+    # Every row holds the same series_id, so it's a dictionary column: one int8 index per row into a single
+    # entry (pandas reads it as a Categorical, parquet stores it dictionary-encoded).
+    series_id = series.get("series_id")
+    n = len(data)
+    if series_id is not None:
+        series_ids = pa.DictionaryArray.from_arrays(pa.array(np.zeros(n, dtype=np.int8)), pa.array([series_id]))
+    else:
+        series_ids = pa.nulls(n, pa.dictionary(pa.int8(), pa.string()))
+
+    if not data:
+        return pa.table({
+            "date": pa.array([], pa.date32()),
+            "series_id": series_ids,
+            "value": pa.array([], pa.float32()),
+        })
+
+    # One (n, 2) object array, then each column is parsed in a single vectorized pass.
+    arr = np.asarray(data, dtype=object)
 
-    # pd.to_datetime converts date strings to datetime; errors="coerce" -> NaT on bad input
-    df["date"] = pd.to_datetime(df['date'], errors = 'coerce') 
+    dates = _parse_dates(pa.array(arr[:, 0], type=pa.string(), from_pandas=True))
 
-    # keep the series_id so downstream joins know which signal it is
-    df["series_id"] = series.get("series_id") # metadata copied into each row
+    # pd.to_numeric parses numeric strings (and passes numbers through); errors="coerce" -> NaN on bad input,
+    # which Arrow's string -> float cast can't do. float32 halves the bytes per value vs float64, and
+    # pa.array wraps the NumPy buffer without copying.
+    values = pa.array(pd.to_numeric(arr[:, 1], errors="coerce").astype("float32"))
 
-    # df[["col1", "col2"]] selects a subset of columns in a specific order.
-    # Using double brackets returns a DataFrame (not a Series), which keeps the
-    # tabular shape consistent for downstream merges and exports.
-    return df[["date", "series_id", "value"]]
+    # The dict's key order sets the column order: date, series_id, value.
+    return pa.table({"date": dates, "series_id": series_ids, "value": values})
+
+# datetime64[ns] covers 1677-09-22 .. 2262-04-11; dates outside it (eg: a "9999-12-31" sentinel) become NaT
+_ns_date_min = pa.scalar(pd.Timestamp.min.ceil("D").date(), pa.date32())
+_ns_date_max = pa.scalar(pd.Timestamp.max.floor("D").date(), pa.date32())
+
+def _table_to_frame(table: pa.Table) -> pd.DataFrame:
+    # Cast date32 to timestamp[ns] first: to_pandas(date_as_object=False) alone gives datetime64[ms], but
+    # downstream code (merges, resample, the silver layer) expects the datetime64[ns] that pd.to_datetime returns.
+    i = table.schema.get_field_index("date")
+    if i >= 0 and table.schema.field(i).type == pa.date32():
+        # null out dates ns can't hold first, so one bad date doesn't fail the cast for the whole series
+        dates = table.column(i)
+        in_range = pc.and_(pc.greater_equal(dates, _ns_date_min), pc.less_equal(dates, _ns_date_max))
+        dates = pc.if_else(in_range, dates, pa.scalar(None, pa.date32()))
+        table = table.set_column(i, "date", dates.cast(pa.timestamp("ns")))
+    return table.to_pandas()
+
+def series_to_frame(series: Dict[str, List[List[str]]]) -> pd.DataFrame:
+    # the pandas view of series_to_arrow, for callers that work with DataFrames
+    return _table_to_frame(series_to_arrow(series))
 
     # Beautiful! We've successfully built the EIA client that can fetch series data and convert it to a clean dataframe.
     # We can now move on to building the bronze ingestion scripts that will use this client to fetch data and write it to storage.
@@ -78,4 +387,239 @@ def series_to_frame(series: Dict[str, List[List[str]]]) -> pd.DataFrame:
     #     ---------------------------------------------
     #     2024-01-05   | PET.MCREXUS1.M    |   75.12
     #     2024-01-04   | PET.MCREXUS1.M    |   74.50
-    #     ...          | ...               |   ...
\ No newline at end of file
+    #     ...          | ...               |   ...
+
+# Walkthrough (optional): a local parquet cache for parsed series.
+# EIA history doesn't change once published, so during development we can keep the parsed frame on disk and
+# only re-download it after the TTL expires. Each series gets one file named by a hash of its series_id.
+
+# On top of the disk cache, the last few parsed frames are kept in memory, so a long-running process (eg: the API,
+# or a pipeline that asks for the same series from several tasks) skips the parquet read too.
+# It's an LRU: an OrderedDict keeps entries oldest-first, a hit moves its entry to the end, and once there are more
+# than EIA_MEM_CACHE_MAX_ENTRIES entries the oldest is dropped (0 disables it). The lock makes it safe to share
+# across the fetch_series_many threads.
+mem_cache_max_entries = int(os.getenv("EIA_MEM_CACHE_MAX_ENTRIES", "32"))
+_mem_cache: OrderedDict[str, tuple[float, pd.DataFrame]] = OrderedDict() # series_id -> (fetched at, df)
+_mem_lock = threading.Lock()
+
+def _mem_get(series_id: str, max_age: float) -> pd.DataFrame | None:
+    with _mem_lock:
+        entry = _mem_cache.get(series_id)
+        if entry is None:
+            return None
+        fetched_at, df = entry
+        if time.time() - fetched_at >= max_age: # same TTL as the disk cache
+            del _mem_cache[series_id]
+            return None
+        _mem_cache.move_to_end(series_id) # mark as most recently used
+    # a shallow copy is a new frame over the same column data, so callers can add/drop/rename columns
+    # without changing the cached frame
+    return df.copy(deep=False)
+
+def _mem_put(series_id: str, df: pd.DataFrame, fetched_at: float) -> None:
+    if mem_cache_max_entries <= 0:
+        return
+    with _mem_lock:
+        _mem_cache[series_id] = (fetched_at, df)
+        _mem_cache.move_to_end(series_id)
+        while len(_mem_cache) > mem_cache_max_entries:
+            _mem_cache.popitem(last=False) # evict the least recently used entry
+
+def _cache_path(series_id: str) -> Path:
+    # sha1 of the series_id gives a filesystem-safe, fixed-length file name
+    key = hashlib.sha1(series_id.encode("utf-8")).hexdigest()
+    return cache_dir / f"{key}.parquet"
+
+def _cache_lookup(series_id: str, max_age: float) -> pd.DataFrame | None:
+    # a fresh cached frame for series_id (memory first, then disk), or None on a miss
+    df = _mem_get(series_id, max_age)
+    if df is not None:
+        return df # hot: already parsed in this process
+
+    path = _cache_path(series_id)
+    if path.exists():
+        mtime = path.stat().st_mtime
+        if time.time() - mtime < max_age:
+            df = _table_to_frame(pq.read_table(path)) # warm cache: skip both the request and parsing
+            _mem_put(series_id, df, fetched_at=mtime)
+            return df.copy(deep=False)
+    return None
+
+def _cache_store(series_id: str, table: pa.Table) -> pd.DataFrame:
+    # write a freshly parsed series to the disk and memory caches, and return its frame
+    df = _table_to_frame(table)
+
+    # record the series_id and fetch time in the parquet key-value metadata for auditability
+    metadata = {
+        **(table.schema.metadata or {}),
+        b"series_id": series_id.encode("utf-8"),
+        b"fetched_at": pd.Timestamp.utcnow().isoformat().encode("utf-8"),
+    }
+    table = table.replace_schema_metadata(metadata)
+
+    path = _cache_path(series_id)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # write to a temp file then rename, so a crash mid-write never leaves a truncated cache entry behind.
+    # mkstemp gives each writer its own temp name: two overlapping misses on one series (eg: two DAG tasks)
+    # each rename a complete file into place, and the last one wins, instead of one moving the other's file away.
+    fd, tmp_name = tempfile.mkstemp(dir=cache_dir, prefix=f"{path.stem}.", suffix=".parquet.tmp")
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+    try:
+        pq.write_table(table, tmp_path, compression="zstd")
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    _mem_put(series_id, df, fetched_at=path.stat().st_mtime)
+    return df.copy(deep=False)
+
+def cached_fetch_series(series_id: str, api_key: str | None = None, ttl: str | None = None) -> pd.DataFrame:
+    # Same result as series_to_frame(fetch_series(...)), but served from the parquet cache while it is fresh.
+    # ttl is any pd.Timedelta string like "24h" or "7d"; defaults to EIA_CACHE_TTL.
+    if os.getenv("EIA_NOCACHE") == "1":
+        return series_to_frame(fetch_series(series_id, api_key=api_key))
+
+    df = _cache_lookup(series_id, pd.Timedelta(ttl or default_cache_ttl).total_seconds())
+    if df is not None:
+        return df
+    return _cache_store(series_id, series_to_arrow(fetch_series(series_id, api_key=api_key)))
+
+def clear_cache(series_id: str | None = None) -> None:
+    # drop one series from the cache (disk and memory), or every cached series when series_id is None
+    if series_id is not None:
+        with _mem_lock:
+            _mem_cache.pop(series_id, None)
+        _cache_path(series_id).unlink(missing_ok=True)
+        return
+    with _mem_lock:
+        _mem_cache.clear()
+    if cache_dir.exists():
+        for path in cache_dir.glob("*.parquet"):
+            path.unlink(missing_ok=True)
+
+# Walkthrough (optional): fetching many series at once.
+# Each fetch mostly waits on the network, and blocking socket I/O releases the GIL, so a thread pool overlaps
+# the round-trips: N series take about ceil(N / max_workers) round-trips instead of N.
+# All threads share one client: the HTTP/2 client when httpx is installed (requests multiplex over its connection,
+# up to 16 connections), otherwise the module-level _session (its pool holds 16, so keep max_workers <= 16).
+def fetch_series_many(
+    series_ids: List[str], api_key: str | None = None, max_workers: int = 8
+) -> Dict[str, pd.DataFrame | Exception]:
+    # Returns {series_id: df}. A series that fails maps to its exception instead of failing the whole batch,
+    # so callers can check isinstance(result, Exception) per series.
+    out: Dict[str, pd.DataFrame | Exception] = {}
+    series_ids = list(dict.fromkeys(series_ids)) # one fetch per distinct id, first-seen order kept
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # each future remembers which series_id it was submitted for
+        futures = {executor.submit(cached_fetch_series, sid, api_key): sid for sid in series_ids}
+        for future in as_completed(futures): # yields futures as they finish, in completion order
+            sid = futures[future]
+            try:
+                out[sid] = future.result()
+            except Exception as exc:
+                out[sid] = exc
+    return out
+
+# The event-loop version: asyncio.gather runs every fetch concurrently on one thread (bounded by the async
+# client's max_connections), with no thread pool at all. Unlike fetch_series_many it always hits the API.
+async def fetch_series_many_async(
+    series_ids: List[str], api_key: str | None = None
+) -> Dict[str, pd.DataFrame | Exception]:
+    async def _one(sid: str) -> pd.DataFrame:
+        # fetch and parse together, so a payload that fails to parse is caught like a failed request
+        return series_to_frame(await fetch_series_async(sid, api_key=api_key))
+
+    # return_exceptions=True hands back a failed series' exception in its slot instead of cancelling the rest,
+    # matching fetch_series_many's {series_id: df or exception} result
+    results = await asyncio.gather(*(_one(sid) for sid in series_ids), return_exceptions=True)
+    return dict(zip(series_ids, results))
+
+# Walkthrough (optional): batching series into one v2 request.
+# Threads and keep-alive overlap round-trips, but each series is still its own request for EIA to serve.
+# The v2 API takes several series from the same route in one call (repeated facets[series][] params), so
+# 50 series become 2 requests of 25. v2 names a series by its middle code and frequency, eg: the v1 id
+# "PET.RWTC.D" is series "RWTC" at daily frequency on the petroleum/pri/spt route.
+v2_frequencies = {"D": "daily", "W": "weekly", "M": "monthly", "Q": "quarterly", "A": "annual"}
+v2_page_size = 5000 # the most rows v2 returns per request; longer results are paged with offset
+
+def _v2_rows(route: str, facets: List[str], frequency: str, api_key: str) -> List[dict]:
+    # every row for these series, following v2's offset pagination until `total` rows have arrived
+    rows: List[dict] = []
+    while True:
+        response = _get(
+            {
+                "api_key": api_key,
+                "frequency": frequency,
+                "data[0]": "value",
+                "facets[series][]": facets, # a list becomes one repeated query param per series
+                "offset": len(rows),
+                "length": v2_page_size,
+            },
+            url=f"{v2_base_url}{route.strip('/')}/data/",
+        )
+        try:
+            response.raise_for_status()
+            body = _json_loads(response.content)["response"]
+        finally:
+            response.close()
+        page = body.get("data", [])
+        rows.extend(page)
+        if not page or len(rows) >= int(body.get("total", 0)):
+            return rows
+
+def fetch_series_batch(
+    series_ids: List[str], route: str, api_key: str | None = None, batch_size: int = 25, ttl: str | None = None
+) -> Dict[str, pd.DataFrame]:
+    # Fetch v1-style series ids that all live on one v2 route (eg: route="petroleum/pri/spt"), up to batch_size
+    # per request. Returns {series_id: df} with the same columns as series_to_frame.
+    # Uses the same parquet/memory cache as cached_fetch_series: fresh ids aren't requested at all, and fetched
+    # ones are stored for next time. Any id v2 can't serve (unrecognized id, or no rows back) falls back to the
+    # per-series v1 path.
+    api_key = _resolve_api_key(api_key)
+    use_cache = os.getenv("EIA_NOCACHE") != "1"
+    max_age = pd.Timedelta(ttl or default_cache_ttl).total_seconds()
+
+    # group by frequency (one v2 request can only ask for one), keyed by v2 facet code -> v1 id
+    out: Dict[str, pd.DataFrame] = {}
+    groups: Dict[str, Dict[str, str]] = {}
+    fallback: List[str] = []
+    for sid in series_ids:
+        if sid in out:
+            continue
+        cached = _cache_lookup(sid, max_age) if use_cache else None
+        if cached is not None:
+            out[sid] = cached
+            continue
+        parts = sid.split(".")
+        if len(parts) != 3 or parts[2] not in v2_frequencies:
+            fallback.append(sid)
+            continue
+        by_facet = groups.setdefault(v2_frequencies[parts[2]], {})
+        if by_facet.get(parts[1], sid) != sid:
+            # another id already claimed this facet code (eg: PET.X.D and NG.X.D); v2 rows only carry the code,
+            # so they can't be told apart in one request
+            fallback.append(sid)
+            continue
+        by_facet[parts[1]] = sid
+
+    for frequency, by_facet in groups.items():
+        facets = list(by_facet)
+        for start in range(0, len(facets), batch_size):
+            chunk = facets[start:start + batch_size]
+            # split the flat response rows back into one [period, value] list per series
+            data: Dict[str, List[list]] = {facet: [] for facet in chunk}
+            for row in _v2_rows(route, chunk, frequency, api_key):
+                if row.get("series") in data:
+                    data[row["series"]].append([row.get("period"), row.get("value")])
+            for facet, rows in data.items():
+                sid = by_facet[facet]
+                if not rows:
+                    fallback.append(sid)
+                    continue
+                table = series_to_arrow({"series_id": sid, "data": rows})
+                out[sid] = _cache_store(sid, table) if use_cache else _table_to_frame(table)
+
+    for sid in fallback:
+        out[sid] = cached_fetch_series(sid, api_key=api_key, ttl=ttl)
+    return out
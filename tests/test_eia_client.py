@@ -0,0 +1,288 @@
+# Checks for src/io/eia_client.py. No network: fetch_series is replaced with a counting fake.
+
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.io.eia_client as eia
+
+
+def _payload(series_id: str) -> dict:
+    return {"series_id": series_id, "data": [["2024-01-12", "76.5"], ["2024-01-05", "75.12"]]}
+
+
+@pytest.fixture
+def fake_fetch(monkeypatch, tmp_path):
+    # point the disk cache at a temp dir and count how often the "API" is hit
+    calls = []
+
+    def fetch(series_id, api_key=None):
+        calls.append(series_id)
+        return _payload(series_id)
+
+    monkeypatch.setattr(eia, "cache_dir", tmp_path)
+    monkeypatch.setattr(eia, "fetch_series", fetch)
+    monkeypatch.delenv("EIA_NOCACHE", raising=False)
+    eia.clear_cache()
+    yield calls
+    eia.clear_cache()
+
+
+def test_disk_cache_serves_fresh_entries_and_refetches_stale_ones(fake_fetch, monkeypatch):
+    monkeypatch.setattr(eia, "mem_cache_max_entries", 0) # disk cache only
+    first = eia.cached_fetch_series("PET.RWTC.D", ttl="1h")
+    second = eia.cached_fetch_series("PET.RWTC.D", ttl="1h")
+    assert fake_fetch == ["PET.RWTC.D"]
+    assert first.equals(second)
+
+    # age the file past the TTL
+    path = eia._cache_path("PET.RWTC.D")
+    old = time.time() - 2 * 3600
+    os.utime(path, (old, old))
+    eia.cached_fetch_series("PET.RWTC.D", ttl="1h")
+    assert fake_fetch == ["PET.RWTC.D", "PET.RWTC.D"]
+
+
+def test_overlapping_cache_writes_for_one_series_all_succeed(fake_fetch):
+    # every writer renames its own temp file, so concurrent misses never move each other's file away
+    from concurrent.futures import ThreadPoolExecutor
+    table = eia.series_to_arrow(_payload("PET.RWTC.D"))
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        frames = list(executor.map(lambda _: eia._cache_store("PET.RWTC.D", table), range(32)))
+    assert all(len(df) == 2 for df in frames)
+    assert [p.name for p in eia.cache_dir.iterdir()] == [eia._cache_path("PET.RWTC.D").name] # no temp files left
+
+
+def test_fetch_series_many_fetches_each_id_once(fake_fetch):
+    out = eia.fetch_series_many(["PET.RWTC.D", "PET.RWTC.D", "PET.RBRTE.D", "PET.RWTC.D"])
+    assert sorted(out) == ["PET.RBRTE.D", "PET.RWTC.D"]
+    assert not any(isinstance(result, Exception) for result in out.values())
+    assert sorted(fake_fetch) == ["PET.RBRTE.D", "PET.RWTC.D"]
+
+
+def test_nocache_env_always_fetches(fake_fetch, monkeypatch):
+    monkeypatch.setenv("EIA_NOCACHE", "1")
+    eia.cached_fetch_series("PET.RWTC.D")
+    eia.cached_fetch_series("PET.RWTC.D")
+    assert fake_fetch == ["PET.RWTC.D", "PET.RWTC.D"]
+    assert not eia._cache_path("PET.RWTC.D").exists()
+
+
+def test_memory_lru_evicts_least_recently_used(fake_fetch, monkeypatch):
+    monkeypatch.setattr(eia, "mem_cache_max_entries", 2)
+    for sid in ("A", "B", "A", "C"): # touching A again makes B the oldest entry
+        eia.cached_fetch_series(sid)
+    assert list(eia._mem_cache) == ["A", "C"]
+
+
+def test_memory_hit_skips_disk_and_returns_a_shallow_copy(fake_fetch, monkeypatch):
+    monkeypatch.setattr(eia, "mem_cache_max_entries", 4)
+    df = eia.cached_fetch_series("A")
+    eia._cache_path("A").unlink() # a hit must not need the parquet file
+    df["extra"] = 1 # callers can add columns without touching the cached frame
+    again = eia.cached_fetch_series("A")
+    assert fake_fetch == ["A"]
+    assert "extra" not in again.columns
+
+
+def test_memory_entries_expire_with_the_ttl(fake_fetch, monkeypatch):
+    monkeypatch.setattr(eia, "mem_cache_max_entries", 4)
+    eia.cached_fetch_series("A", ttl="1h")
+    fetched_at, df = eia._mem_cache["A"]
+    eia._mem_cache["A"] = (fetched_at - 2 * 3600, df)
+    eia._cache_path("A").unlink()
+    eia.cached_fetch_series("A", ttl="1h")
+    assert fake_fetch == ["A", "A"]
+
+
+def test_clear_cache_drops_memory_and_disk(fake_fetch):
+    eia.cached_fetch_series("A")
+    eia.clear_cache("A")
+    assert "A" not in eia._mem_cache
+    assert not eia._cache_path("A").exists()
+
+
+def test_fetch_series_many_async_keeps_other_results_when_one_fails(monkeypatch):
+    httpx = pytest.importorskip("httpx")
+
+    def handler(request):
+        sid = request.url.params["series_id"]
+        if sid == "BAD":
+            return httpx.Response(200, json={"series": ["not a series dict"]}) # fetches fine, fails to parse
+        return httpx.Response(200, json={"series": [_payload(sid)]})
+
+    # route fetch_series_async through an httpx mock transport instead of the network
+    monkeypatch.setattr(eia, "HTTP2_AVAILABLE", True)
+    monkeypatch.setattr(eia, "_get_async_client", lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    out = eia.asyncio.run(eia.fetch_series_many_async(["A", "BAD", "B"], api_key="k"))
+    assert isinstance(out["BAD"], Exception)
+    assert list(out["A"]["value"]) == pytest.approx([76.5, 75.12])
+    assert len(out["B"]) == 2
+
+
+def test_async_client_is_rebuilt_after_aclose(monkeypatch):
+    pytest.importorskip("httpx")
+    monkeypatch.setattr(eia, "_async_http2_client", None)
+
+    async def lifespan_cycle():
+        client = eia._get_async_client()
+        await eia.aclose_session()
+        return client
+
+    first = eia.asyncio.run(lifespan_cycle())
+    second = eia.asyncio.run(lifespan_cycle())
+    assert first.is_closed and second.is_closed and first is not second
+
+
+def test_async_client_is_rebuilt_for_a_new_event_loop(monkeypatch):
+    pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from threading import Thread
+    from urllib.parse import parse_qs, urlparse
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1" # keep connections alive, so the client has something to reuse
+
+        def do_GET(self):
+            sid = parse_qs(urlparse(self.path).query)["series_id"][0]
+            body = json.dumps({"series": [_payload(sid)]}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(eia, "base_url", f"http://127.0.0.1:{server.server_port}/")
+    monkeypatch.setattr(eia, "_async_http2_client", None)
+    try:
+        # two asyncio.run cycles with no aclose_session() in between: the second loop must not reuse the
+        # first loop's keep-alive connections
+        for _ in range(2):
+            out = eia.asyncio.run(eia.fetch_series_many_async(["A", "B"], api_key="k"))
+            assert not any(isinstance(result, Exception) for result in out.values()), out
+            assert len(out["A"]) == 2
+    finally:
+        server.shutdown()
+        server.server_close()
+        eia._async_http2_client = None
+
+
+def test_sync_client_is_rebuilt_after_close_session(monkeypatch):
+    pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+    monkeypatch.setattr(eia, "_http2_client", None)
+    first = eia._get_http2_client()
+    assert eia._get_http2_client() is first
+    eia.close_session()
+    assert first.is_closed
+    second = eia._get_http2_client()
+    assert second is not first and not second.is_closed
+    eia.close_session()
+
+
+class _ChunkedResponse:
+    # stands in for a streamed requests.Response: the decompressed body arrives in small chunks
+    def __init__(self, body: bytes, chunk_size: int = 7):
+        self._chunks = [body[i:i + chunk_size] for i in range(0, len(body), chunk_size)]
+        self.closed = False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size=None):
+        return iter(self._chunks)
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.mark.parametrize("stream_min_bytes", [10**9, 16]) # whole-body parse vs. switching to ijson mid-body
+def test_fetch_series_remote_parses_streamed_body(monkeypatch, stream_min_bytes):
+    if stream_min_bytes < 10**9:
+        pytest.importorskip("ijson")
+    body = {"series": [{**_payload("X"), "name": "WTI spot", "units": "$/bbl"}]}
+    response = _ChunkedResponse(json.dumps(body).encode())
+    monkeypatch.setattr(eia, "HTTP2_AVAILABLE", False) # requests-style response
+    monkeypatch.setattr(eia, "_get", lambda params, stream=False, url=None: response)
+    monkeypatch.setattr(eia, "stream_min_bytes", stream_min_bytes)
+
+    series = eia._fetch_series_remote("X", "k")
+    assert [row[0] for row in series["data"]] == ["2024-01-12", "2024-01-05"]
+    assert [float(row[1]) for row in series["data"]] == [76.5, 75.12]
+    assert response.closed
+
+
+def test_fetch_series_batch_uses_the_cache_and_splits_facet_collisions(fake_fetch, monkeypatch):
+    requests_made = []
+
+    def v2_rows(route, facets, frequency, api_key):
+        requests_made.append(list(facets))
+        return [{"series": f, "period": "2024-01-05", "value": "1.5"} for f in facets]
+
+    monkeypatch.setattr(eia, "_v2_rows", v2_rows)
+    ids = ["PET.RWTC.D", "PET.RBRTE.D", "NG.RWTC.D"] # NG.RWTC.D shares RWTC with PET.RWTC.D
+
+    out = eia.fetch_series_batch(ids, "petroleum/pri/spt", api_key="k")
+    assert sorted(out) == sorted(ids)
+    assert requests_made == [["RWTC", "RBRTE"]]
+    assert fake_fetch == ["NG.RWTC.D"] # the colliding id went through the per-series v1 path
+
+    # second call: everything is served from the cache
+    again = eia.fetch_series_batch(ids, "petroleum/pri/spt", api_key="k")
+    assert requests_made == [["RWTC", "RBRTE"]]
+    assert fake_fetch == ["NG.RWTC.D"]
+    assert again["PET.RBRTE.D"].equals(out["PET.RBRTE.D"])
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("2024-01-05", "2024-01-05"), # daily/weekly
+    ("20240105", "2024-01-05"),
+    ("2024-01", "2024-01-01"), # monthly
+    ("202401", "2024-01-01"),
+    ("2024", "2024-01-01"), # annual
+    ("2024Q1", "2024-01-01"), # quarterly, v1 and v2 spelling
+    ("2024-Q3", "2024-07-01"),
+    ("01/05/2024", "2024-01-05"), # not an EIA layout: pandas infers it
+    ("9999-12-31", None), # outside datetime64[ns] -> NaT instead of failing the series
+])
+def test_series_to_frame_dates_match_pandas(raw, expected):
+    df = eia.series_to_frame({"series_id": "PET.X.D", "data": [[raw, "1.5"], [None, "2"], ["garbage", "x"]]})
+    assert df["date"].dtype == "datetime64[ns]"
+    if expected is None:
+        assert pd.isna(df["date"].iloc[0])
+    else:
+        assert df["date"].iloc[0] == pd.Timestamp(expected)
+    assert df["date"].iloc[1:].isna().all() # bad or missing dates -> NaT, like pd.to_datetime(errors="coerce")
+    assert df["value"].iloc[0] == pytest.approx(1.5)
+    assert np.isnan(df["value"].iloc[2])
+    assert (df["series_id"] == "PET.X.D").all()
+
+
+def test_series_to_frame_without_series_id_or_data():
+    df = eia.series_to_frame({"data": [["2024-01-05", "1"]]})
+    assert df["series_id"].isna().all()
+    assert df["date"].dtype == "datetime64[ns]"
+
+    empty = eia.series_to_frame({"series_id": "PET.X.D"})
+    assert list(empty.columns) == ["date", "series_id", "value"]
+    assert empty.empty and empty["date"].dtype == "datetime64[ns]"
+
+
+def test_cache_round_trip_keeps_ns_dates(fake_fetch):
+    first = eia.cached_fetch_series("PET.X.D")
+    eia._mem_cache.clear() # force the parquet read path
+    second = eia.cached_fetch_series("PET.X.D")
+    assert second["date"].dtype == "datetime64[ns]"
+    pd.testing.assert_frame_equal(first, second)
@@ -0,0 +1,32 @@
+# Checks the NumPy feature kernels in notebooks/gold_features.py against the pandas code they replaced.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from notebooks.gold_features import _rolling_std
+
+
+def _series_with_gaps(n: int = 200, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    x = rng.normal(0.0, 0.02, n)
+    x[[0, 17, 18, 90, 150]] = np.nan # leading NaN (like return_1w) plus gaps inside the series
+    return x
+
+
+@pytest.mark.parametrize("window", [2, 4, 13])
+def test_rolling_std_matches_pandas(window):
+    x = _series_with_gaps()
+    expected = pd.Series(x).rolling(window).std().to_numpy()
+    np.testing.assert_allclose(_rolling_std(x, window), expected, rtol=1e-9, atol=1e-12, equal_nan=True)
+
+
+def test_rolling_std_large_offset_is_stable():
+    # the x**2 cumulative sums lose precision when values sit far from zero (eg: raw prices, not returns)
+    x = 80.0 + _series_with_gaps(seed=1)
+    expected = pd.Series(x).rolling(4).std().to_numpy()
+    np.testing.assert_allclose(_rolling_std(x, 4), expected, rtol=1e-4, atol=1e-6, equal_nan=True)
+
+
+def test_rolling_std_shorter_than_window_is_all_nan():
+    assert np.isnan(_rolling_std(np.array([1.0, 2.0]), 4)).all()
@@ -0,0 +1,29 @@
+# Checks the Welford kernel in pipelines/_numba_kernels.py against pandas. Without numba installed the
+# njit decorator is a no-op, so the same code runs as plain Python.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pipelines._numba_kernels import rolling_std_fixed
+
+
+@pytest.mark.parametrize("window", [2, 4, 13])
+def test_rolling_std_fixed_matches_pandas(window):
+    rng = np.random.default_rng(0)
+    x = rng.normal(0.0, 0.02, 300)
+    x[[0, 1, 40, 41, 42, 200]] = np.nan # NaNs leaving and re-entering the window exercise the inverse update
+    expected = pd.Series(x).rolling(window).std().to_numpy()
+    np.testing.assert_allclose(rolling_std_fixed(x, window), expected, rtol=1e-8, atol=1e-12, equal_nan=True)
+
+
+def test_rolling_std_fixed_recovers_after_all_nan_window():
+    x = np.array([1.0, 2.0, np.nan, np.nan, np.nan, np.nan, 3.0, 5.0, 4.0, 6.0])
+    expected = pd.Series(x).rolling(4).std().to_numpy()
+    np.testing.assert_allclose(rolling_std_fixed(x, 4), expected, equal_nan=True)
+
+
+def test_rolling_std_fixed_constant_series_is_zero():
+    out = rolling_std_fixed(np.full(10, 75.0), 4)
+    assert np.isnan(out[:3]).all()
+    np.testing.assert_allclose(out[3:], 0.0, atol=1e-12)
@@ -0,0 +1,43 @@
+# Checks the Arrow weekly alignment in notebooks/silver_clean.py against pandas' resample("W-FRI").ffill().
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from notebooks.silver_clean import _align_weekly
+
+
+def _expected(df: pd.DataFrame) -> pd.DataFrame:
+    out = df.dropna(subset=["date"]).set_index("date").sort_index().resample("W-FRI").ffill()
+    return out.reset_index()
+
+
+def test_align_weekly_matches_resample_ffill():
+    rng = np.random.default_rng(0)
+    # unsorted business days with gaps (eg: a Friday holiday), so the fill has to reach back to earlier rows
+    dates = pd.bdate_range("2023-01-02", "2023-06-30")
+    dates = dates.delete([4, 9, 10, 30]) # drop a few days, including Fridays
+    df = pd.DataFrame({"date": dates, "value": rng.normal(75, 2, len(dates))}).sample(frac=1, random_state=0)
+
+    got = _align_weekly(pa.Table.from_pandas(df, preserve_index=False)).to_pandas()
+    expected = _expected(df)
+
+    pd.testing.assert_series_equal(got["date"], expected["date"].astype("datetime64[ns]"), check_freq=False)
+    np.testing.assert_allclose(got["value"], expected["value"].astype("float32"), rtol=1e-6)
+
+
+def test_align_weekly_drops_missing_dates_and_keeps_other_columns():
+    df = pd.DataFrame({
+        "date": pd.to_datetime(["2024-01-03", None, "2024-01-10", "2024-01-19"]),
+        "value": [1.0, 99.0, 2.0, 3.0],
+        "source_type": pd.Categorical(["prices"] * 4),
+    })
+    got = _align_weekly(pa.Table.from_pandas(df, preserve_index=False)).to_pandas()
+    assert list(got["date"]) == list(pd.to_datetime(["2024-01-05", "2024-01-12", "2024-01-19"]))
+    assert list(got["value"]) == [1.0, 2.0, 3.0]
+    assert list(got["source_type"]) == ["prices"] * 3
+
+
+def test_align_weekly_empty_table():
+    tbl = pa.table({"date": pa.array([], pa.timestamp("ns")), "value": pa.array([], pa.float64())})
+    assert _align_weekly(tbl).num_rows == 0